@@ -4,6 +4,7 @@ Investec API MCP Configuration
 This module provides configuration for the Investec API MCP server using Pydantic for type safety.
 """
 
+import functools
 import logging
 import os
 
@@ -11,9 +12,6 @@ from dotenv import find_dotenv, load_dotenv
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# Load environment variables from .env file
-load_dotenv(find_dotenv(usecwd=True))
-
 # Configure logging
 logger = logging.getLogger("investec-config")
 
@@ -31,6 +29,9 @@ class InvestecConfig(BaseSettings):
         False, description="Whether to use the sandbox environment"
     )
     timeout: int = Field(30, description="Timeout for API calls in seconds")
+    cache_ttl: float = Field(
+        30, description="Seconds to cache read-only tool results; 0 disables"
+    )
 
     # Base URLs
     production_url: str = Field(
@@ -52,6 +53,8 @@ class InvestecConfig(BaseSettings):
 
     def model_post_init(self, __context) -> None:
         """Log configuration status after initialization."""
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         logger.debug(
             "Configuration: client_id=%s, client_secret=%s, api_key=%s, use_sandbox=%s, timeout=%s",
             f"{self.client_id[:4]}..." if self.client_id else "Not set",
@@ -81,6 +84,8 @@ def load_config(test_mode: bool = False) -> InvestecConfig:
         test_mode: If True, uses the sandbox environment by default and
                   provides test default values if credentials aren't set.
     """
+    _load_env_file()
+
     # Test default values (used only in test_mode if no real values are provided)
     test_defaults = {
         "client_id": "yAxzQRFX97vOcyQAwluEU6H6ePxMA5eY",
@@ -89,62 +94,58 @@ def load_config(test_mode: bool = False) -> InvestecConfig:
         "use_sandbox": True,
     }
 
-    # First check for prefixed variables
-    try:
-        config_args = {
-            "client_id": os.environ.get("INVESTEC_CLIENT_ID", ""),
-            "client_secret": os.environ.get("INVESTEC_CLIENT_SECRET", ""),
-            "api_key": os.environ.get("INVESTEC_API_KEY", ""),
-            "use_sandbox": test_mode
-            or os.environ.get("INVESTEC_USE_SANDBOX", "").lower() == "true",
-            "timeout": int(os.environ.get("INVESTEC_TIMEOUT", "30")),
-            "production_url": os.environ.get(
-                "INVESTEC_PRODUCTION_URL", "https://openapi.investec.com"
-            ),
-            "sandbox_url": os.environ.get(
-                "INVESTEC_SANDBOX_URL", "https://openapisandbox.investec.com"
-            ),
-        }
-
-        # If any required field is missing, we'll fall through to non-prefixed variables
-        if (
-            not config_args["client_id"]
-            or not config_args["client_secret"]
-            or not config_args["api_key"]
-        ):
-            raise ValueError("Missing required credentials with INVESTEC_ prefix")
-
-        return InvestecConfig(**config_args)
-    except Exception:
-        # Try non-prefixed variables
-        config_args = {
-            "client_id": os.environ.get("CLIENT_ID", ""),
-            "client_secret": os.environ.get("CLIENT_SECRET", ""),
-            "api_key": os.environ.get("API_KEY", ""),
-            "use_sandbox": test_mode
-            or os.environ.get("USE_SANDBOX", "").lower() == "true",
-            "timeout": int(os.environ.get("TIMEOUT", "30")),
-            "production_url": os.environ.get(
-                "PRODUCTION_URL", "https://openapi.investec.com"
-            ),
-            "sandbox_url": os.environ.get(
-                "SANDBOX_URL", "https://openapisandbox.investec.com"
-            ),
-        }
-
-        # In test mode, apply test defaults if credentials are missing
-        if test_mode:
-            if not config_args["client_id"]:
-                config_args["client_id"] = test_defaults["client_id"]
-            if not config_args["client_secret"]:
-                config_args["client_secret"] = test_defaults["client_secret"]
-            if not config_args["api_key"]:
-                config_args["api_key"] = test_defaults["api_key"]
-            if not os.environ.get("USE_SANDBOX"):
-                config_args["use_sandbox"] = test_defaults["use_sandbox"]
-
-        return InvestecConfig(**config_args)
-
-
-# Create a global instance to be imported for regular use
-config = load_config()
+    # Use the INVESTEC_* prefixed variables when all credentials are set with
+    # the prefix, otherwise fall back to the non-prefixed names
+    prefix = (
+        "INVESTEC_"
+        if all(
+            os.environ.get(f"INVESTEC_{name}")
+            for name in ("CLIENT_ID", "CLIENT_SECRET", "API_KEY")
+        )
+        else ""
+    )
+
+    def env(name: str, default: str = "") -> str:
+        return os.environ.get(prefix + name, default)
+
+    config_args = {
+        "client_id": env("CLIENT_ID"),
+        "client_secret": env("CLIENT_SECRET"),
+        "api_key": env("API_KEY"),
+        "use_sandbox": test_mode or env("USE_SANDBOX").lower() == "true",
+        "timeout": int(env("TIMEOUT", "30")),
+        "cache_ttl": float(env("CACHE_TTL", "30")),
+        "production_url": env("PRODUCTION_URL", "https://openapi.investec.com"),
+        "sandbox_url": env("SANDBOX_URL", "https://openapisandbox.investec.com"),
+    }
+
+    # In test mode, apply test defaults if credentials are missing
+    if test_mode and not prefix:
+        for key in ("client_id", "client_secret", "api_key"):
+            if not config_args[key]:
+                config_args[key] = test_defaults[key]
+        if not env("USE_SANDBOX"):
+            config_args["use_sandbox"] = test_defaults["use_sandbox"]
+
+    return InvestecConfig(**config_args)
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env_file() -> None:
+    """Load environment variables from the nearest .env file, once per process."""
+    load_dotenv(find_dotenv(usecwd=True))
+
+
+@functools.lru_cache(maxsize=1)
+def _build() -> InvestecConfig:
+    """Build the global configuration instance."""
+    return load_config()
+
+
+def __getattr__(name: str):
+    """Create the global ``config`` instance lazily on first access."""
+    if name == "config":
+        global config
+        config = _build()
+        return config
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
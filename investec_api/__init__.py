@@ -4,28 +4,49 @@ Investec API Python Client
 A typed Python wrapper for the Investec Open Banking API.
 """
 
-from investec_api.client import InvestecClient
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from investec_api.exceptions import (
     InvestecAPIError,
     InvestecAuthError,
     InvestecRateLimitError,
     InvestecRequestError,
 )
-from investec_api.models import (
-    Account,
-    AccountBalance,
-    Beneficiary,
-    BeneficiaryCategory,
-    BeneficiaryPaymentRequest,
-    Document,
-    Profile,
-    Transaction,
-    TransferRequest,
-    TransferResponse,
-)
+
+if TYPE_CHECKING:
+    from investec_api.client import InvestecClient
+    from investec_api.models import (
+        Account,
+        AccountBalance,
+        Beneficiary,
+        BeneficiaryCategory,
+        BeneficiaryPaymentRequest,
+        Document,
+        Profile,
+        Transaction,
+        TransferRequest,
+        TransferResponse,
+    )
 
 __version__ = "0.1.0"
 
+# The client and models are imported on first attribute access so that
+# ``import investec_api`` does not pull in requests and every model module.
+_LAZY = {
+    "InvestecClient": "investec_api.client",
+    "Account": "investec_api.models.account",
+    "AccountBalance": "investec_api.models.account",
+    "Transaction": "investec_api.models.transaction",
+    "Beneficiary": "investec_api.models.beneficiary",
+    "BeneficiaryCategory": "investec_api.models.beneficiary",
+    "TransferRequest": "investec_api.models.transfer",
+    "TransferResponse": "investec_api.models.transfer",
+    "BeneficiaryPaymentRequest": "investec_api.models.payment",
+    "Profile": "investec_api.models.profile",
+    "Document": "investec_api.models.document",
+}
+
 __all__ = [
     "InvestecClient",
     "InvestecAPIError",
@@ -43,3 +64,17 @@ __all__ = [
     "Profile",
     "Document",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the client and model classes on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> List[str]:
+    """Include the lazily imported names in ``dir()``."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -1,12 +1,33 @@
 """Client for the Investec API."""
 
 import base64
+import hashlib
+import json
+import os
+import tempfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional, Union, cast
-from urllib.parse import urljoin
+from itertools import islice
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    overload,
+)
 
-import requests
+import msgspec
 
 from investec_api.exceptions import (
     InvestecAPIError,
@@ -14,7 +35,9 @@ from investec_api.exceptions import (
     InvestecRateLimitError,
     InvestecRequestError,
 )
+from investec_api.models._fast import decode_transactions
 from investec_api.models.account import Account, AccountBalance
+from investec_api.models.base import BaseModel, _dumps, _loads
 from investec_api.models.beneficiary import Beneficiary, BeneficiaryCategory
 from investec_api.models.document import Document
 from investec_api.models.payment import (
@@ -30,6 +53,21 @@ from investec_api.models.transfer import (
     TransferResponse,
 )
 
+if TYPE_CHECKING:
+    import requests
+
+T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
+
+
+def _format_date(value: Union[date, datetime, str]) -> str:
+    """Format a date as an ISO string (YYYY-MM-DD) for the API."""
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
 
 class InvestecClient:
     """Client for interacting with the Investec API."""
@@ -39,6 +77,41 @@ class InvestecClient:
     TOKEN_URL_PATH = "/identity/v2/oauth2/token"
     DEFAULT_TIMEOUT = 30  # seconds
 
+    # API endpoint paths, relative to the base URL
+    API_ROOT = "/za/pb/v1"
+    ACCOUNTS_PATH = API_ROOT + "/accounts"
+    ACCOUNT_BALANCE_PATH = ACCOUNTS_PATH + "/{account_id}/balance"
+    ACCOUNT_TRANSACTIONS_PATH = ACCOUNTS_PATH + "/{account_id}/transactions"
+    ACCOUNT_PENDING_TRANSACTIONS_PATH = (
+        ACCOUNTS_PATH + "/{account_id}/pending-transactions"
+    )
+    TRANSFER_MULTIPLE_PATH = ACCOUNTS_PATH + "/{account_id}/transfermultiple"
+    PAY_MULTIPLE_PATH = ACCOUNTS_PATH + "/{account_id}/paymultiple"
+    BENEFICIARIES_PATH = ACCOUNTS_PATH + "/beneficiaries"
+    BENEFICIARY_CATEGORIES_PATH = ACCOUNTS_PATH + "/beneficiarycategories"
+    DOCUMENTS_PATH = ACCOUNTS_PATH + "/{account_id}/documents"
+    DOCUMENT_PATH = ACCOUNTS_PATH + "/{account_id}/document/{document_type}/{date}"
+    PROFILES_PATH = API_ROOT + "/profiles"
+    PROFILE_ACCOUNTS_PATH = PROFILES_PATH + "/{profile_id}/accounts"
+    AUTHORISATION_SETUP_PATH = (
+        PROFILE_ACCOUNTS_PATH + "/{account_id}/authorisationsetupdetails"
+    )
+    PROFILE_BENEFICIARIES_PATH = PROFILE_ACCOUNTS_PATH + "/{account_id}/beneficiaries"
+
+    # Connection pool and retry settings for the shared HTTP session
+    POOL_CONNECTIONS = 4
+    POOL_MAXSIZE = 8
+    MAX_RETRIES = 3
+    RETRY_BACKOFF_FACTOR = 0.3
+    RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+    # Maximum concurrent requests for the per-account fan-out helpers
+    MAX_WORKERS = POOL_MAXSIZE
+
+    # Directory for cached OAuth tokens shared between processes; None means
+    # $XDG_CACHE_HOME/investec-sapb-mcp, resolved only when caching is enabled
+    TOKEN_CACHE_DIR: Optional[Path] = None
+
     def __init__(
         self,
         client_id: str,
@@ -46,6 +119,7 @@ class InvestecClient:
         api_key: str,
         use_sandbox: bool = False,
         timeout: int = DEFAULT_TIMEOUT,
+        cache_token: bool = True,
     ) -> None:
         """Initialize the Investec API client.
 
@@ -55,6 +129,8 @@ class InvestecClient:
             api_key: The API key (x-api-key) value
             use_sandbox: Whether to use the sandbox environment (default: False)
             timeout: Timeout for API calls in seconds (default: 30)
+            cache_token: Whether to cache the access token on disk so new
+                processes can reuse it until it expires (default: True)
         """
         self.client_id = client_id
         self.client_secret = client_secret
@@ -62,49 +138,204 @@ class InvestecClient:
         self.base_url = self.SANDBOX_URL if use_sandbox else self.PRODUCTION_URL
         self.timeout = timeout
 
+        # All API paths are absolute, so URLs are built by concatenation
+        self._base = self.base_url.rstrip("/")
+
+        # Basic auth (client_id:client_secret) headers for the token request
+        basic_auth = base64.b64encode(f"{client_id}:{client_secret}".encode()).decode()
+        self._token_request_headers = {
+            "Authorization": f"Basic {basic_auth}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+
         # Authentication state
         self._access_token: Optional[str] = None
         self._token_expires_at: Optional[float] = None
+        # Bearer header for the current token, rebuilt only when it rotates
+        self._auth_headers: Dict[str, str] = {}
+        self._auth_lock = threading.Lock()
+        self._token_cache_path: Optional[Path] = None
+        if cache_token:
+            cache_dir = self._token_cache_dir()
+            if cache_dir is not None:
+                key = hashlib.sha256(
+                    f"{client_id}:{self.base_url}".encode()
+                ).hexdigest()
+                self._token_cache_path = cache_dir / f"token-{key[:32]}.json"
+                self._load_cached_token()
+
+        # Shared HTTP session, created on first use
+        self._session: Optional["requests.Session"] = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self) -> "requests.Session":
+        """Get the shared HTTP session, creating it on first use.
+
+        Reusing one session keeps the TLS connection to the API open across
+        calls instead of doing a fresh handshake for every request.
+        """
+        if self._session is None:
+            with self._session_lock:
+                # Another thread may have created it while we waited
+                if self._session is None:
+                    self._session = self._create_session()
+        return self._session
+
+    def _create_session(self) -> "requests.Session":
+        """Create the HTTP session with pooling, retries and default headers."""
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+
+        # Only GETs are retried on error statuses; retrying a POST could
+        # submit a transfer or payment twice.
+        retries = Retry(
+            total=self.MAX_RETRIES,
+            backoff_factor=self.RETRY_BACKOFF_FACTOR,
+            status_forcelist=self.RETRY_STATUS_CODES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=self.POOL_MAXSIZE,
+            max_retries=retries,
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.headers.update(
+            {"x-api-key": self.api_key, "Accept": "application/json"}
+        )
+        return session
 
-    def _get_auth_headers(self) -> Dict[str, str]:
-        """Get the authentication headers for API requests."""
-        if (
+    def close(self) -> None:
+        """Close the shared HTTP session and its pooled connections."""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def _token_expired(self) -> bool:
+        """Check whether the access token is missing or due for refresh."""
+        return (
             not self._access_token
             or not self._token_expires_at
             or time.time() >= self._token_expires_at
-        ):
-            self._authenticate()
+        )
 
-        return {
-            "Authorization": f"Bearer {self._access_token}",
-            "x-api-key": self.api_key,
-            "Accept": "application/json",
-        }
+    def _get_auth_headers(self, force: bool = False) -> Dict[str, str]:
+        """Get the authentication headers for API requests.
+
+        Only one thread refreshes an expired token; any others wait for it
+        and then reuse the new token.
+
+        Args:
+            force: Fetch a new token even if the current one is still valid
+        """
+        if force or self._token_expired():
+            with self._auth_lock:
+                # Another thread may have refreshed the token while we waited
+                if force or self._token_expired():
+                    self._authenticate()
+
+        return self._auth_headers
+
+    def _fan_out(
+        self, func: Callable[[str], T], account_ids: Iterable[str]
+    ) -> Dict[str, T]:
+        """Call ``func`` for each account ID concurrently on the shared session.
+
+        Args:
+            func: Per-account method to call
+            account_ids: The IDs of the accounts
+
+        Returns:
+            Dictionary mapping each account ID to its result
+        """
+        account_ids = list(account_ids)
+        if not account_ids:
+            return {}
+
+        # Create the session and token up front so the workers don't race to
+        # authenticate.
+        self._get_session()
+        self._get_auth_headers()
+
+        workers = min(self.MAX_WORKERS, len(account_ids))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return dict(zip(account_ids, executor.map(func, account_ids)))
+
+    @classmethod
+    def _token_cache_dir(cls) -> Optional[Path]:
+        """Get the token cache directory, or None if there's no home to put it in."""
+        if cls.TOKEN_CACHE_DIR is not None:
+            return cls.TOKEN_CACHE_DIR
+        cache_home = os.environ.get("XDG_CACHE_HOME")
+        if not cache_home:
+            try:
+                cache_home = str(Path.home() / ".cache")
+            except (RuntimeError, KeyError):
+                # No HOME and no passwd entry; run without the on-disk cache
+                return None
+        return Path(cache_home) / "investec-sapb-mcp"
+
+    def _load_cached_token(self) -> None:
+        """Reuse an unexpired access token cached by a previous process."""
+        if self._token_cache_path is None:
+            return
+        try:
+            cached = json.loads(self._token_cache_path.read_text())
+            token, expires_at = cached["token"], float(cached["expires_at"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return
+
+        if token and expires_at > time.time():
+            self._access_token = token
+            self._token_expires_at = expires_at
+            self._auth_headers = {"Authorization": f"Bearer {token}"}
+
+    def _save_cached_token(self) -> None:
+        """Write the current access token to the cache file, readable only by us."""
+        if self._token_cache_path is None:
+            return
+        try:
+            self._token_cache_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            # mkstemp creates the file with 0600 permissions; os.replace makes
+            # the update atomic for concurrent readers.
+            fd, tmp_path = tempfile.mkstemp(dir=self._token_cache_path.parent)
+            with os.fdopen(fd, "w") as f:
+                json.dump(
+                    {"token": self._access_token, "expires_at": self._token_expires_at},
+                    f,
+                )
+            os.replace(tmp_path, self._token_cache_path)
+        except OSError:
+            pass
+
+    def _discard_cached_token(self) -> None:
+        """Delete the cache file so new processes don't reload a rejected token."""
+        if self._token_cache_path is None:
+            return
+        try:
+            self._token_cache_path.unlink()
+        except OSError:
+            pass
 
     def _authenticate(self) -> None:
         """Authenticate with the Investec API and get an access token."""
-        # Prepare basic auth (client_id:client_secret)
-        auth_header = base64.b64encode(
-            f"{self.client_id}:{self.client_secret}".encode()
-        ).decode()
-
-        headers = {
-            "Authorization": f"Basic {auth_header}",
-            "x-api-key": self.api_key,
-            "Content-Type": "application/x-www-form-urlencoded",
-        }
+        import requests
 
         data = {"grant_type": "client_credentials"}
 
         try:
-            response = requests.post(
-                urljoin(self.base_url, self.TOKEN_URL_PATH),
-                headers=headers,
+            response = self._get_session().post(
+                self._base + self.TOKEN_URL_PATH,
+                headers=self._token_request_headers,
                 data=data,
                 timeout=self.timeout,
             )
             response.raise_for_status()
-            auth_data = response.json()
+            auth_data = _loads(response.content)
 
             self._access_token = auth_data.get("access_token")
             expires_in = auth_data.get(
@@ -117,11 +348,32 @@ class InvestecClient:
             if not self._access_token:
                 raise InvestecAuthError("No access token in response")
 
+            self._auth_headers = {"Authorization": f"Bearer {self._access_token}"}
+
+            self._save_cached_token()
+
         except requests.exceptions.HTTPError as e:
             raise InvestecAuthError(f"Authentication failed: {str(e)}")
-        except (requests.exceptions.RequestException, ValueError) as e:
+        except (
+            requests.exceptions.RequestException,
+            ValueError,
+            msgspec.DecodeError,
+        ) as e:
             raise InvestecAuthError(f"Authentication request failed: {str(e)}")
 
+    @overload
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        *,
+        raw: Literal[False] = False,
+    ) -> Dict[str, Any]: ...
+
+    @overload
     def _request(
         self,
         method: str,
@@ -129,7 +381,20 @@ class InvestecClient:
         params: Optional[Dict[str, Any]] = None,
         data: Optional[Dict[str, Any]] = None,
         json_data: Optional[Dict[str, Any]] = None,
-    ) -> Dict[str, Any]:
+        *,
+        raw: Literal[True],
+    ) -> bytes: ...
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+        *,
+        raw: bool = False,
+    ) -> Union[Dict[str, Any], bytes]:
         """Make a request to the Investec API.
 
         Args:
@@ -138,50 +403,67 @@ class InvestecClient:
             params: Query parameters
             data: Form data
             json_data: JSON data for the request body
+            raw: Return the undecoded response body as bytes
 
         Returns:
-            API response as a dictionary
+            API response as a dictionary, or as bytes when ``raw`` is set
         """
-        url = urljoin(self.base_url, path)
-        headers = self._get_auth_headers()
+        import requests
 
-        if json_data:
-            headers["Content-Type"] = "application/json"
+        url = self._base + path
 
-        try:
-            response = requests.request(
+        body: Any = data
+        content_headers: Dict[str, str] = {}
+        if json_data is not None:
+            body = _dumps(json_data)
+            content_headers = {"Content-Type": "application/json"}
+
+        def send(auth_headers: Dict[str, str]) -> "requests.Response":
+            return self._get_session().request(
                 method=method,
                 url=url,
-                headers=headers,
+                headers={**auth_headers, **content_headers},
                 params=params,
-                data=data,
-                json=json_data,
+                data=body,
                 timeout=self.timeout,
             )
 
+        try:
+            response = send(self._get_auth_headers())
+
+            if response.status_code == 401:
+                # The token may have been revoked or rotated before its stored
+                # expiry; drop it, on disk too, and retry once with a new one.
+                # A 401 means the request was rejected, so retrying is safe.
+                self._discard_cached_token()
+                response = send(self._get_auth_headers(force=True))
+
             if response.status_code == 429:
                 raise InvestecRateLimitError(
                     "Rate limit exceeded, retry after a delay",
                     response.status_code,
-                    response.json() if response.text else None,
+                    _loads(response.content) if response.content else None,
                 )
 
             response.raise_for_status()
 
+            if raw:
+                return response.content
+
             # Some endpoints might return empty responses
-            if not response.text:
+            if not response.content:
                 return {}
 
-            return cast(Dict[str, Any], response.json())
+            return _loads(response.content)
 
         except requests.exceptions.HTTPError as e:
             if e.response is not None:
                 status_code = e.response.status_code
                 error_data = None
                 try:
-                    if e.response.text:
-                        error_data = e.response.json()
-                except ValueError:
+                    if e.response.content:
+                        error_data = _loads(e.response.content)
+                except (ValueError, msgspec.DecodeError):
                     pass
 
                 raise InvestecRequestError(
@@ -192,7 +474,33 @@ class InvestecClient:
             raise InvestecAPIError(f"HTTP error occurred: {str(e)}")
         except requests.exceptions.RequestException as e:
             raise InvestecAPIError(f"Request failed: {str(e)}")
-        except ValueError as e:
+        except (ValueError, msgspec.DecodeError) as e:
+            raise InvestecAPIError(f"Invalid JSON in response: {str(e)}")
+
+    def _request_model(
+        self,
+        model: Type[M],
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json_data: Optional[Dict[str, Any]] = None,
+    ) -> M:
+        """Make a request to the Investec API and build a model from the body.
+
+        Args:
+            model: Model class to build from the response
+            method: HTTP method (GET, POST, etc.)
+            path: API endpoint path
+            params: Query parameters
+            json_data: JSON data for the request body
+
+        Returns:
+            The model instance
+        """
+        raw = self._request(method, path, params, json_data=json_data, raw=True)
+        try:
+            return model.from_json(raw)
+        except msgspec.DecodeError as e:
             raise InvestecAPIError(f"Invalid JSON in response: {str(e)}")
 
     # Account Information Methods
@@ -203,12 +511,19 @@ class InvestecClient:
         Returns:
             List of Account objects
         """
-        response = self._request("GET", "/za/pb/v1/accounts")
-        if "data" in response and "accounts" in response["data"]:
-            return [
-                Account.from_dict(account) for account in response["data"]["accounts"]
-            ]
-        return []
+        return list(self.iter_accounts())
+
+    def iter_accounts(self) -> Iterator[Account]:
+        """Iterate over all accounts for the authenticated user.
+
+        Accounts are built one at a time as the caller consumes them.
+
+        Returns:
+            Iterator of Account objects
+        """
+        response = self._request("GET", self.ACCOUNTS_PATH)
+        for account in response.get("data", {}).get("accounts", ()):
+            yield Account.from_dict(account)
 
     def get_account_balance(self, account_id: str) -> AccountBalance:
         """Get the balance for a specific account.
@@ -219,8 +534,11 @@ class InvestecClient:
         Returns:
             AccountBalance object with balance information
         """
-        response = self._request("GET", f"/za/pb/v1/accounts/{account_id}/balance")
-        return AccountBalance.from_api_response(response)
+        return self._request_model(
+            AccountBalance,
+            "GET",
+            self.ACCOUNT_BALANCE_PATH.format(account_id=account_id),
+        )
 
     def get_account_transactions(
         self,
@@ -229,6 +547,7 @@ class InvestecClient:
         to_date: Optional[Union[date, datetime, str]] = None,
         transaction_type: Optional[str] = None,
         include_pending: bool = False,
+        limit: Optional[int] = None,
     ) -> List[Transaction]:
         """Get transactions for a specific account.
 
@@ -238,24 +557,51 @@ class InvestecClient:
             to_date: End date for transactions (default: today)
             transaction_type: Filter transactions by type
             include_pending: Include pending transactions
+            limit: Maximum number of transactions to return (default: all).
+                The API has no paging, so this only skips building the rest.
 
         Returns:
             List of Transaction objects
         """
+        transactions = self.iter_account_transactions(
+            account_id,
+            from_date=from_date,
+            to_date=to_date,
+            transaction_type=transaction_type,
+            include_pending=include_pending,
+        )
+        return list(islice(transactions, limit))
+
+    def iter_account_transactions(
+        self,
+        account_id: str,
+        from_date: Optional[Union[date, datetime, str]] = None,
+        to_date: Optional[Union[date, datetime, str]] = None,
+        transaction_type: Optional[str] = None,
+        include_pending: bool = False,
+    ) -> Iterator[Transaction]:
+        """Iterate over transactions for a specific account.
+
+        Transactions are built one at a time as the caller consumes them, so
+        callers that stop early skip parsing the rest of the response.
+
+        Args:
+            account_id: The ID of the account
+            from_date: Start date for transactions (default: 180 days ago)
+            to_date: End date for transactions (default: today)
+            transaction_type: Filter transactions by type
+            include_pending: Include pending transactions
+
+        Returns:
+            Iterator of Transaction objects
+        """
         params: Dict[str, str] = {}
 
-        # Format dates as ISO strings (YYYY-MM-DD)
         if from_date:
-            if isinstance(from_date, (date, datetime)):
-                params["fromDate"] = from_date.strftime("%Y-%m-%d")
-            else:
-                params["fromDate"] = str(from_date)
+            params["fromDate"] = _format_date(from_date)
 
         if to_date:
-            if isinstance(to_date, (date, datetime)):
-                params["toDate"] = to_date.strftime("%Y-%m-%d")
-            else:
-                params["toDate"] = str(to_date)
+            params["toDate"] = _format_date(to_date)
 
         if transaction_type:
             params["transactionType"] = transaction_type
@@ -263,15 +609,29 @@ class InvestecClient:
         if include_pending:
             params["includePending"] = "true"
 
-        response = self._request(
-            "GET", f"/za/pb/v1/accounts/{account_id}/transactions", params=params
+        raw = self._request(
+            "GET",
+            self.ACCOUNT_TRANSACTIONS_PATH.format(account_id=account_id),
+            params=params,
+            raw=True,
         )
+        if not raw:
+            return
 
-        if "data" in response and "transactions" in response["data"]:
-            return [
-                Transaction.from_dict(txn) for txn in response["data"]["transactions"]
-            ]
-        return []
+        # Decode straight into typed structs; if the payload doesn't match the
+        # expected field types, fall back to the lenient dict-based parsing.
+        try:
+            rows = decode_transactions(raw).data.transactions
+        except msgspec.ValidationError:
+            response = _loads(raw)
+            for txn in response.get("data", {}).get("transactions", ()):
+                yield Transaction.from_dict(txn)
+            return
+        except msgspec.DecodeError as e:
+            raise InvestecAPIError(f"Invalid JSON in response: {str(e)}")
+
+        for row in rows:
+            yield Transaction.from_struct(row)
 
     def get_account_pending_transactions(
         self, account_id: str
@@ -285,7 +645,8 @@ class InvestecClient:
             List of PendingTransaction objects
         """
         response = self._request(
-            "GET", f"/za/pb/v1/accounts/{account_id}/pending-transactions"
+            "GET",
+            self.ACCOUNT_PENDING_TRANSACTIONS_PATH.format(account_id=account_id),
         )
 
         if "data" in response and "PendingTransaction" in response["data"]:
@@ -295,6 +656,48 @@ class InvestecClient:
             ]
         return []
 
+    def get_all_balances(self, account_ids: Iterable[str]) -> Dict[str, AccountBalance]:
+        """Get the balances for several accounts concurrently.
+
+        Args:
+            account_ids: The IDs of the accounts
+
+        Returns:
+            Dictionary mapping each account ID to its AccountBalance
+        """
+        return self._fan_out(self.get_account_balance, account_ids)
+
+    def get_all_transactions(
+        self,
+        account_ids: Iterable[str],
+        from_date: Optional[Union[date, datetime, str]] = None,
+        to_date: Optional[Union[date, datetime, str]] = None,
+        transaction_type: Optional[str] = None,
+        include_pending: bool = False,
+    ) -> Dict[str, List[Transaction]]:
+        """Get transactions for several accounts concurrently.
+
+        Args:
+            account_ids: The IDs of the accounts
+            from_date: Start date for transactions (default: 180 days ago)
+            to_date: End date for transactions (default: today)
+            transaction_type: Filter transactions by type
+            include_pending: Include pending transactions
+
+        Returns:
+            Dictionary mapping each account ID to its list of Transaction objects
+        """
+        return self._fan_out(
+            lambda account_id: self.get_account_transactions(
+                account_id,
+                from_date=from_date,
+                to_date=to_date,
+                transaction_type=transaction_type,
+                include_pending=include_pending,
+            ),
+            account_ids,
+        )
+
     # Inter-account Transfer Methods
 
     def transfer_multiple(
@@ -317,14 +720,13 @@ class InvestecClient:
             transfer_list=transfers, profile_id=profile_id
         )
 
-        response = self._request(
+        return self._request_model(
+            TransferResponse,
             "POST",
-            f"/za/pb/v1/accounts/{account_id}/transfermultiple",
+            self.TRANSFER_MULTIPLE_PATH.format(account_id=account_id),
             json_data=transfer_request.to_dict(),
         )
 
-        return TransferResponse.from_api_response(response)
-
     # Beneficiary Methods
 
     def get_beneficiaries(self) -> List[Beneficiary]:
@@ -333,13 +735,22 @@ class InvestecClient:
         Returns:
             List of Beneficiary objects
         """
-        response = self._request("GET", "/za/pb/v1/accounts/beneficiaries")
+        return list(self.iter_beneficiaries())
+
+    def iter_beneficiaries(self) -> Iterator[Beneficiary]:
+        """Iterate over all beneficiaries for the authenticated user.
+
+        Beneficiaries are built one at a time as the caller consumes them.
+
+        Returns:
+            Iterator of Beneficiary objects
+        """
+        response = self._request("GET", self.BENEFICIARIES_PATH)
         # API returns an array directly in data
-        if "data" in response and isinstance(response["data"], list):
-            return [
-                Beneficiary.from_dict(beneficiary) for beneficiary in response["data"]
-            ]
-        return []
+        data = response.get("data")
+        if isinstance(data, list):
+            for beneficiary in data:
+                yield Beneficiary.from_dict(beneficiary)
 
     def get_beneficiary_categories(self) -> BeneficiaryCategory:
         """Get beneficiary categories.
@@ -347,8 +758,9 @@ class InvestecClient:
         Returns:
             BeneficiaryCategory object
         """
-        response = self._request("GET", "/za/pb/v1/accounts/beneficiarycategories")
-        return BeneficiaryCategory.from_api_response(response)
+        return self._request_model(
+            BeneficiaryCategory, "GET", self.BENEFICIARY_CATEGORIES_PATH
+        )
 
     def pay_beneficiaries(
         self, account_id: str, payments: List[BeneficiaryPaymentItem]
@@ -364,14 +776,13 @@ class InvestecClient:
         """
         payment_request = BeneficiaryPaymentRequest(payment_list=payments)
 
-        response = self._request(
+        return self._request_model(
+            PaymentResponse,
             "POST",
-            f"/za/pb/v1/accounts/{account_id}/paymultiple",
+            self.PAY_MULTIPLE_PATH.format(account_id=account_id),
             json_data=payment_request.to_dict(),
         )
 
-        return PaymentResponse.from_api_response(response)
-
     # Profile Methods
 
     def get_profiles(self) -> List[Profile]:
@@ -380,7 +791,7 @@ class InvestecClient:
         Returns:
             List of Profile objects
         """
-        response = self._request("GET", "/za/pb/v1/profiles")
+        response = self._request("GET", self.PROFILES_PATH)
         if "data" in response and isinstance(response["data"], list):
             return [Profile.from_dict(profile) for profile in response["data"]]
         return []
@@ -394,7 +805,9 @@ class InvestecClient:
         Returns:
             List of Account objects
         """
-        response = self._request("GET", f"/za/pb/v1/profiles/{profile_id}/accounts")
+        response = self._request(
+            "GET", self.PROFILE_ACCOUNTS_PATH.format(profile_id=profile_id)
+        )
         if "data" in response and isinstance(response["data"], list):
             return [Account.from_dict(account) for account in response["data"]]
         return []
@@ -411,11 +824,13 @@ class InvestecClient:
         Returns:
             AuthorisationSetup object
         """
-        response = self._request(
+        return self._request_model(
+            AuthorisationSetup,
             "GET",
-            f"/za/pb/v1/profiles/{profile_id}/accounts/{account_id}/authorisationsetupdetails",
+            self.AUTHORISATION_SETUP_PATH.format(
+                profile_id=profile_id, account_id=account_id
+            ),
         )
-        return AuthorisationSetup.from_api_response(response)
 
     def get_profile_beneficiaries(
         self, profile_id: str, account_id: str
@@ -431,7 +846,9 @@ class InvestecClient:
         """
         response = self._request(
             "GET",
-            f"/za/pb/v1/profiles/{profile_id}/accounts/{account_id}/beneficiaries",
+            self.PROFILE_BENEFICIARIES_PATH.format(
+                profile_id=profile_id, account_id=account_id
+            ),
         )
         if "data" in response and isinstance(response["data"], list):
             return [
@@ -457,21 +874,13 @@ class InvestecClient:
         Returns:
             List of Document objects
         """
-        params: Dict[str, str] = {}
-
-        # Format dates as ISO strings (YYYY-MM-DD)
-        if isinstance(from_date, (date, datetime)):
-            params["fromDate"] = from_date.strftime("%Y-%m-%d")
-        else:
-            params["fromDate"] = str(from_date)
-
-        if isinstance(to_date, (date, datetime)):
-            params["toDate"] = to_date.strftime("%Y-%m-%d")
-        else:
-            params["toDate"] = str(to_date)
+        params = {
+            "fromDate": _format_date(from_date),
+            "toDate": _format_date(to_date),
+        }
 
         response = self._request(
-            "GET", f"/za/pb/v1/accounts/{account_id}/documents", params=params
+            "GET", self.DOCUMENTS_PATH.format(account_id=account_id), params=params
         )
         if "data" in response and isinstance(response["data"], list):
             return [Document.from_dict(document) for document in response["data"]]
@@ -493,37 +902,9 @@ class InvestecClient:
         Returns:
             Raw document data as bytes
         """
-        # Format date as ISO string (YYYY-MM-DD)
-        if isinstance(document_date, (date, datetime)):
-            date_str = document_date.strftime("%Y-%m-%d")
-        else:
-            date_str = str(document_date)
-
-        url = urljoin(
-            self.base_url,
-            f"/za/pb/v1/accounts/{account_id}/document/{document_type}/{date_str}",
+        path = self.DOCUMENT_PATH.format(
+            account_id=account_id,
+            document_type=document_type,
+            date=_format_date(document_date),
         )
-        headers = self._get_auth_headers()
-
-        try:
-            response = requests.get(url, headers=headers, timeout=self.timeout)
-            response.raise_for_status()
-            return response.content
-        except requests.exceptions.HTTPError as e:
-            if e.response is not None:
-                status_code = e.response.status_code
-                error_data = None
-                try:
-                    if e.response.text:
-                        error_data = e.response.json()
-                except ValueError:
-                    pass
-
-                raise InvestecRequestError(
-                    f"HTTP error occurred: {str(e)}",
-                    status_code,
-                    error_data,
-                )
-            raise InvestecAPIError(f"HTTP error occurred: {str(e)}")
-        except requests.exceptions.RequestException as e:
-            raise InvestecAPIError(f"Request failed: {str(e)}")
+        return self._request("GET", path, raw=True)
@@ -1,12 +1,34 @@
 """Data models for the Investec API."""
 
-from investec_api.models.account import Account, AccountBalance
-from investec_api.models.beneficiary import Beneficiary, BeneficiaryCategory
-from investec_api.models.document import Document
-from investec_api.models.payment import BeneficiaryPaymentRequest, PaymentResponse
-from investec_api.models.profile import AuthorisationSetup, Profile
-from investec_api.models.transaction import PendingTransaction, Transaction
-from investec_api.models.transfer import TransferRequest, TransferResponse
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from investec_api.models.account import Account, AccountBalance
+    from investec_api.models.beneficiary import Beneficiary, BeneficiaryCategory
+    from investec_api.models.document import Document
+    from investec_api.models.payment import BeneficiaryPaymentRequest, PaymentResponse
+    from investec_api.models.profile import AuthorisationSetup, Profile
+    from investec_api.models.transaction import PendingTransaction, Transaction
+    from investec_api.models.transfer import TransferRequest, TransferResponse
+
+# Each model module is imported on first access to one of its classes, so
+# using one model doesn't load all of them.
+_LAZY = {
+    "Account": "investec_api.models.account",
+    "AccountBalance": "investec_api.models.account",
+    "Transaction": "investec_api.models.transaction",
+    "PendingTransaction": "investec_api.models.transaction",
+    "Beneficiary": "investec_api.models.beneficiary",
+    "BeneficiaryCategory": "investec_api.models.beneficiary",
+    "TransferRequest": "investec_api.models.transfer",
+    "TransferResponse": "investec_api.models.transfer",
+    "BeneficiaryPaymentRequest": "investec_api.models.payment",
+    "PaymentResponse": "investec_api.models.payment",
+    "Profile": "investec_api.models.profile",
+    "AuthorisationSetup": "investec_api.models.profile",
+    "Document": "investec_api.models.document",
+}
 
 __all__ = [
     "Account",
@@ -23,3 +45,17 @@ __all__ = [
     "AuthorisationSetup",
     "Document",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import model classes on first access."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(_LAZY[name]), name)
+    globals()[name] = obj
+    return obj
+
+
+def __dir__() -> List[str]:
+    """Include the lazily imported names in ``dir()``."""
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,44 @@
+"""msgspec structs mirroring hot-path API payloads.
+
+Responses are decoded from bytes straight into these structs, skipping the
+intermediate dicts, and then converted to the public models.
+"""
+
+from decimal import Decimal
+from typing import List, Optional
+
+import msgspec
+
+
+class TransactionStruct(msgspec.Struct, rename="camel"):
+    """Wire format of a single transaction."""
+
+    account_id: str = ""
+    type: Optional[str] = None
+    transaction_type: Optional[str] = None
+    status: Optional[str] = None
+    description: str = ""
+    card_number: Optional[str] = None
+    posted_order: Optional[int] = None
+    posting_date: Optional[str] = None
+    value_date: Optional[str] = None
+    action_date: Optional[str] = None
+    transaction_date: Optional[str] = None
+    amount: Decimal = Decimal(0)
+    running_balance: Optional[Decimal] = None
+    uuid: Optional[str] = None
+
+
+class TransactionsData(msgspec.Struct):
+    """The ``data`` object of a transactions response."""
+
+    transactions: List[TransactionStruct] = []
+
+
+class TransactionsResponse(msgspec.Struct):
+    """Envelope of a transactions response."""
+
+    data: TransactionsData = msgspec.field(default_factory=TransactionsData)
+
+
+decode_transactions = msgspec.json.Decoder(TransactionsResponse).decode
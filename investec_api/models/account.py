@@ -1,10 +1,12 @@
 """Account and balance models for the Investec API."""
 
+from dataclasses import dataclass
 from decimal import Decimal
 
-from investec_api.models.base import BaseModel
+from investec_api.models.base import BaseModel, _to_decimal
 
 
+@dataclass(slots=True, kw_only=True)
 class Account(BaseModel):
     """Investec bank account information."""
 
@@ -17,21 +19,24 @@ class Account(BaseModel):
     profile_id: str
     profile_name: str
 
+    _FIELDS = (
+        ("account_id", "accountId", ""),
+        ("account_number", "accountNumber", ""),
+        ("account_name", "accountName", ""),
+        ("reference_name", "referenceName", ""),
+        ("product_name", "productName", ""),
+        ("kyc_compliant", "kycCompliant", False),
+        ("profile_id", "profileId", ""),
+        ("profile_name", "profileName", ""),
+    )
+
     @classmethod
     def from_dict(cls, data: dict) -> "Account":
         """Create an Account instance from API response data."""
-        return cls(
-            account_id=data.get("accountId", ""),
-            account_number=data.get("accountNumber", ""),
-            account_name=data.get("accountName", ""),
-            reference_name=data.get("referenceName", ""),
-            product_name=data.get("productName", ""),
-            kyc_compliant=data.get("kycCompliant", False),
-            profile_id=data.get("profileId", ""),
-            profile_name=data.get("profileName", ""),
-        )
+        return cls._build(data)
 
 
+@dataclass(slots=True, kw_only=True)
 class AccountBalance(BaseModel):
     """Investec bank account balance information."""
 
@@ -48,10 +53,10 @@ class AccountBalance(BaseModel):
         """Create an AccountBalance instance from API response data."""
         return cls(
             account_id=data.get("accountId", ""),
-            current_balance=Decimal(str(data.get("currentBalance", 0))),
-            available_balance=Decimal(str(data.get("availableBalance", 0))),
-            budget_balance=Decimal(str(data.get("budgetBalance", 0))),
-            straight_balance=Decimal(str(data.get("straightBalance", 0))),
-            cash_balance=Decimal(str(data.get("cashBalance", 0))),
+            current_balance=_to_decimal(data.get("currentBalance", 0)),
+            available_balance=_to_decimal(data.get("availableBalance", 0)),
+            budget_balance=_to_decimal(data.get("budgetBalance", 0)),
+            straight_balance=_to_decimal(data.get("straightBalance", 0)),
+            cash_balance=_to_decimal(data.get("cashBalance", 0)),
             currency=data.get("currency", "ZAR"),
         )
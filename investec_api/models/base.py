@@ -1,22 +1,147 @@
 """Base model class for all API models."""
 
+import sys
+from dataclasses import fields
 from datetime import datetime
-from typing import Any, Dict, List, Type, TypeVar, get_type_hints
+from decimal import Decimal
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+import msgspec
 
 T = TypeVar("T", bound="BaseModel")
 
+# JSON codec shared by the client and models. Non-integer numbers are decoded
+# straight to Decimal so monetary values never pass through float, and Decimals
+# are encoded as strings.
+_loads = msgspec.json.Decoder(float_hook=Decimal).decode
+_dumps = msgspec.json.encode
+
+
+def _to_decimal(value: Any) -> Decimal:
+    """Convert an API numeric value to a Decimal without losing precision."""
+    if isinstance(value, Decimal):
+        return value
+    if isinstance(value, (int, str)):
+        return Decimal(value)
+    # Floats go through their shortest repr to avoid binary rounding noise
+    return Decimal(str(value))
+
+
+_CENTS = Decimal("0.01")
+
+
+def _to_cents(value: Any) -> Decimal:
+    """Convert an amount to a Decimal with exactly two decimal places.
+
+    Raises:
+        ValueError: If the amount isn't a whole number of cents; amounts are
+            never rounded.
+    """
+    amount = _to_decimal(value)
+    cents = amount.quantize(_CENTS)
+    if cents != amount:
+        raise ValueError(f"Amount {value} is not a whole number of cents")
+    return cents
+
+
+def _format_amount(value: Any) -> str:
+    """Format an amount in the fixed-point two-decimal form the API expects."""
+    return format(_to_cents(value), "f")
+
+
+def _intern(value: Any) -> Any:
+    """Intern string values so repeated API codes share one object."""
+    return sys.intern(value) if type(value) is str else value
+
+
+def _compile_build(
+    fields_table: Tuple[Tuple[str, str, Any], ...], interned: FrozenSet[str]
+) -> Callable:
+    """Generate a ``_build`` function specialised for a ``_FIELDS`` table.
+
+    The generated body spells out one ``data.get(key, default)`` per field with
+    constant keys, instead of looping over the table on every call. Attributes
+    listed in ``interned`` are passed through ``_intern``.
+    """
+    namespace: Dict[str, Any] = {}
+    items = "".join(
+        (
+            f"        {attr!r}: _intern(get({key!r}, _d{i})),\n"
+            if attr in interned
+            else f"        {attr!r}: get({key!r}, _d{i}),\n"
+        )
+        for i, (attr, key, _) in enumerate(fields_table)
+    )
+    source = (
+        "def _build(cls, data, **overrides):\n"
+        "    get = data.get\n"
+        "    return cls(**{\n"
+        f"{items}"
+        "        **overrides,\n"
+        "    })\n"
+    )
+    env = {f"_d{i}": default for i, (_, _, default) in enumerate(fields_table)}
+    env["_intern"] = _intern
+    exec(source, env, namespace)
+    return namespace["_build"]
+
+
+@lru_cache(maxsize=None)
+def _field_names(cls: type) -> FrozenSet[str]:
+    """Return the field names of a model class (cached per class)."""
+    return frozenset(f.name for f in fields(cls))
+
 
 class BaseModel:
-    """Base model class for all API models with JSON conversion capabilities."""
+    """Base class for all API models with JSON conversion capabilities.
+
+    Models are declared as ``@dataclass(slots=True, kw_only=True)`` subclasses,
+    so instances have no ``__dict__`` and are built by the generated
+    ``__init__``.
+    """
+
+    __slots__ = ()
+
+    # (attribute, API key, default) triples used by ``_build``
+    _FIELDS: ClassVar[Tuple[Tuple[str, str, Any], ...]] = ()
 
-    def __init__(self, **data: Any) -> None:
-        for key, value in data.items():
-            setattr(self, key, value)
+    # Attributes with a small set of repeated string values, interned by _build
+    _INTERNED: ClassVar[FrozenSet[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Replace ``_build`` with a version generated from the class's ``_FIELDS``."""
+        super().__init_subclass__(**kwargs)
+        if "_FIELDS" in cls.__dict__:
+            cls._build = classmethod(  # type: ignore
+                _compile_build(cls._FIELDS, cls._INTERNED)
+            )
 
     @classmethod
     def from_dict(cls: Type[T], data: Dict[str, Any]) -> T:
         """Create a model instance from a dictionary."""
-        return cls(**{k: v for k, v in data.items() if k in get_type_hints(cls)})
+        names = _field_names(cls)
+        return cls(**{k: v for k, v in data.items() if k in names})
+
+    @classmethod
+    def _build(cls: Type[T], data: Dict[str, Any], **overrides: Any) -> T:
+        """Create a model instance by mapping API keys through ``_FIELDS``.
+
+        Fields that need converting are passed in as ``overrides``.
+        """
+        kwargs = {attr: data.get(key, default) for attr, key, default in cls._FIELDS}
+        kwargs.update(overrides)
+        return cls(**kwargs)
 
     @classmethod
     def from_api_response(cls: Type[T], response: Dict[str, Any]) -> T:
@@ -25,6 +150,14 @@ class BaseModel:
             return cls.from_dict(response["data"])
         return cls.from_dict(response)
 
+    @classmethod
+    def from_json(cls: Type[T], raw: bytes) -> T:
+        """Create a model instance from a raw JSON API response body.
+
+        An empty body is treated as an empty response, as ``_request`` does.
+        """
+        return cls.from_api_response(_loads(raw) if raw else {})
+
     @classmethod
     def list_from_api_response(
         cls: Type[T], response: Dict[str, Any], key: str
@@ -37,7 +170,9 @@ class BaseModel:
     def to_dict(self) -> Dict[str, Any]:
         """Convert model to a dictionary."""
         result: Dict[str, Any] = {}
-        for key, value in self.__dict__.items():
+        for field in fields(self):  # type: ignore[arg-type]
+            key = field.name
+            value = getattr(self, key)
             if isinstance(value, BaseModel):
                 result[key] = value.to_dict()
             elif isinstance(value, list) and value and isinstance(value[0], BaseModel):
@@ -1,10 +1,15 @@
 """Beneficiary models for the Investec API."""
 
+from dataclasses import dataclass
 from typing import Optional
 
 from investec_api.models.base import BaseModel
 
+# String values the API uses for a true flag
+_TRUE_STRINGS = frozenset({"true", "True", "TRUE", "1", "yes", "y"})
 
+
+@dataclass(slots=True, frozen=True, kw_only=True)
 class Beneficiary(BaseModel):
     """Investec bank beneficiary information."""
 
@@ -26,30 +31,36 @@ class Beneficiary(BaseModel):
     beneficiary_type: Optional[str] = None
     approved_beneficiary_category: Optional[str] = None
 
+    _FIELDS = (
+        ("beneficiary_id", "beneficiaryId", ""),
+        ("account_number", "accountNumber", None),
+        ("code", "code", None),
+        ("bank", "bank", None),
+        ("beneficiary_name", "beneficiaryName", None),
+        ("last_payment_amount", "lastPaymentAmount", None),
+        ("last_payment_date", "lastPaymentDate", None),
+        ("cell_no", "cellNo", None),
+        ("email_address", "emailAddress", None),
+        ("name", "name", None),
+        ("reference_account_number", "referenceAccountNumber", None),
+        ("reference_name", "referenceName", None),
+        ("category_id", "categoryId", None),
+        ("profile_id", "profileId", None),
+        ("faster_payment_allowed", "fasterPaymentAllowed", False),
+        ("beneficiary_type", "beneficiaryType", None),
+        ("approved_beneficiary_category", "approvedBeneficiaryCategory", None),
+    )
+    _INTERNED = frozenset(
+        {"bank", "code", "beneficiary_type", "category_id", "profile_id"}
+    )
+
     @classmethod
     def from_dict(cls, data: dict) -> "Beneficiary":
         """Create a Beneficiary instance from API response data."""
-        return cls(
-            beneficiary_id=data.get("beneficiaryId", ""),
-            account_number=data.get("accountNumber"),
-            code=data.get("code"),
-            bank=data.get("bank"),
-            beneficiary_name=data.get("beneficiaryName"),
-            last_payment_amount=data.get("lastPaymentAmount"),
-            last_payment_date=data.get("lastPaymentDate"),
-            cell_no=data.get("cellNo"),
-            email_address=data.get("emailAddress"),
-            name=data.get("name"),
-            reference_account_number=data.get("referenceAccountNumber"),
-            reference_name=data.get("referenceName"),
-            category_id=data.get("categoryId"),
-            profile_id=data.get("profileId"),
-            faster_payment_allowed=data.get("fasterPaymentAllowed", False),
-            beneficiary_type=data.get("beneficiaryType"),
-            approved_beneficiary_category=data.get("approvedBeneficiaryCategory"),
-        )
+        return cls._build(data)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class BeneficiaryCategory(BaseModel):
     """Investec bank beneficiary category information."""
 
@@ -61,13 +72,8 @@ class BeneficiaryCategory(BaseModel):
     def from_dict(cls, data: dict) -> "BeneficiaryCategory":
         """Create a BeneficiaryCategory instance from API response data."""
         # Convert string is_default to boolean
-        is_default = False
-        if "isDefault" in data:
-            is_default = (
-                data["isDefault"].lower() == "true"
-                if isinstance(data["isDefault"], str)
-                else bool(data["isDefault"])
-            )
+        value = data.get("isDefault", False)
+        is_default = value in _TRUE_STRINGS if isinstance(value, str) else bool(value)
 
         return cls(
             id=data.get("id", ""),
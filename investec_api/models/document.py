@@ -1,11 +1,20 @@
 """Document models for the Investec API."""
 
+from dataclasses import dataclass
 from datetime import date
+from functools import lru_cache
 from typing import Any, Dict
 
 from investec_api.models.base import BaseModel
 
 
+@lru_cache(maxsize=1024)
+def _parse_iso_date(value: str) -> date:
+    """Parse an ISO date string, caching repeats across documents."""
+    return date.fromisoformat(value)
+
+
+@dataclass(slots=True, kw_only=True)
 class Document(BaseModel):
     """Investec document information."""
 
@@ -15,15 +24,15 @@ class Document(BaseModel):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Document":
         """Create a Document instance from API response data."""
-        # Convert string date to date object
-        doc_date = None
-        if "documentDate" in data and data["documentDate"]:
+        # Convert string date to date object, falling back to today only
+        # when the date is missing or malformed
+        raw = data.get("documentDate")
+        if raw:
             try:
-                doc_date = date.fromisoformat(data["documentDate"])
+                doc_date = _parse_iso_date(raw)
             except (ValueError, TypeError):
-                pass
-
-        if not doc_date:
+                doc_date = date.today()
+        else:
             doc_date = date.today()
 
         return cls(
@@ -1,11 +1,13 @@
 """Payment models for the Investec API."""
 
+from dataclasses import dataclass
 from decimal import Decimal
-from typing import Any, Dict, List, Optional
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 
-from investec_api.models.base import BaseModel
+from investec_api.models.base import BaseModel, _format_amount, _to_cents
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class BeneficiaryPaymentItem(BaseModel):
     """Individual payment item for beneficiary payments."""
 
@@ -18,39 +20,48 @@ class BeneficiaryPaymentItem(BaseModel):
     auth_period_id: Optional[str] = None
     faster_payment: Optional[bool] = None
 
+    _FIELDS = (
+        ("beneficiary_id", "beneficiaryId", ""),
+        ("my_reference", "myReference", ""),
+        ("their_reference", "theirReference", ""),
+        ("authoriser_a_id", "authoriserAId", None),
+        ("authoriser_b_id", "authoriserBId", None),
+        ("auth_period_id", "authPeriodId", None),
+        ("faster_payment", "fasterPayment", None),
+    )
+    # Optional request keys, emitted only when set.
+    _OPTIONAL: ClassVar[Tuple[Tuple[str, str], ...]] = (
+        ("authoriserAId", "authoriser_a_id"),
+        ("authoriserBId", "authoriser_b_id"),
+        ("authPeriodId", "auth_period_id"),
+        ("fasterPayment", "faster_payment"),
+    )
+
+    def __post_init__(self) -> None:
+        """Reject amounts that would need rounding to whole cents."""
+        _to_cents(self.amount)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API-compatible dictionary."""
         result: Dict[str, Any] = {
             "beneficiaryId": self.beneficiary_id,
-            "amount": str(self.amount),
+            "amount": _format_amount(self.amount),
             "myReference": self.my_reference,
             "theirReference": self.their_reference,
         }
-        if self.authoriser_a_id:
-            result["authoriserAId"] = self.authoriser_a_id
-        if self.authoriser_b_id:
-            result["authoriserBId"] = self.authoriser_b_id
-        if self.auth_period_id:
-            result["authPeriodId"] = self.auth_period_id
-        if self.faster_payment is not None:
-            result["fasterPayment"] = self.faster_payment
+        for key, attr in self._OPTIONAL:
+            value = getattr(self, attr)
+            if value is not None and value != "":
+                result[key] = value
         return result
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "BeneficiaryPaymentItem":
         """Create a BeneficiaryPaymentItem instance from dictionary data."""
-        return cls(
-            beneficiary_id=data.get("beneficiaryId", ""),
-            amount=Decimal(str(data.get("amount", 0))),
-            my_reference=data.get("myReference", ""),
-            their_reference=data.get("theirReference", ""),
-            authoriser_a_id=data.get("authoriserAId"),
-            authoriser_b_id=data.get("authoriserBId"),
-            auth_period_id=data.get("authPeriodId"),
-            faster_payment=data.get("fasterPayment"),
-        )
+        return cls._build(data, amount=_to_cents(data.get("amount", 0)))
 
 
+@dataclass(slots=True, kw_only=True)
 class BeneficiaryPaymentRequest(BaseModel):
     """Request model for beneficiary payments."""
 
@@ -63,6 +74,7 @@ class BeneficiaryPaymentRequest(BaseModel):
         }
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class PaymentResponseItem(BaseModel):
     """Individual payment response for beneficiary payments."""
 
@@ -73,19 +85,22 @@ class PaymentResponseItem(BaseModel):
     beneficiary_account_id: Optional[str] = None
     authorisation_required: bool = False
 
+    _FIELDS = (
+        ("payment_reference_number", "PaymentReferenceNumber", None),
+        ("payment_date", "PaymentDate", None),
+        ("status", "Status", None),
+        ("beneficiary_name", "BeneficiaryName", None),
+        ("beneficiary_account_id", "BeneficiaryAccountId", None),
+        ("authorisation_required", "AuthorisationRequired", False),
+    )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PaymentResponseItem":
         """Create a PaymentResponseItem instance from API response data."""
-        return cls(
-            payment_reference_number=data.get("PaymentReferenceNumber"),
-            payment_date=data.get("PaymentDate"),
-            status=data.get("Status"),
-            beneficiary_name=data.get("BeneficiaryName"),
-            beneficiary_account_id=data.get("BeneficiaryAccountId"),
-            authorisation_required=data.get("AuthorisationRequired", False),
-        )
+        return cls._build(data)
 
 
+@dataclass(slots=True, kw_only=True)
 class PaymentResponse(BaseModel):
     """Response model for beneficiary payments."""
 
@@ -95,17 +110,10 @@ class PaymentResponse(BaseModel):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "PaymentResponse":
         """Create a PaymentResponse instance from API response data."""
-        transfer_responses = []
-
-        # Access the TransferResponses array
-        responses = []
-        if "TransferResponses" in data:
-            responses = data["TransferResponses"]
-
-        for item in responses:
-            transfer_responses.append(PaymentResponseItem.from_dict(item))
-
+        item_from_dict = PaymentResponseItem.from_dict
         return cls(
-            transfer_responses=transfer_responses,
+            transfer_responses=[
+                item_from_dict(item) for item in data.get("TransferResponses", ())
+            ],
             error_message=data.get("ErrorMessage"),
         )
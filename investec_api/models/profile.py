@@ -1,10 +1,12 @@
 """Profile models for the Investec API."""
 
+from dataclasses import dataclass
 from typing import Any, Dict, List
 
 from investec_api.models.base import BaseModel
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class Profile(BaseModel):
     """Investec profile information."""
 
@@ -12,46 +14,55 @@ class Profile(BaseModel):
     profile_name: str
     default_profile: bool = False
 
+    _FIELDS = (
+        ("profile_id", "profileId", ""),
+        ("profile_name", "profileName", ""),
+        ("default_profile", "defaultProfile", False),
+    )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Profile":
         """Create a Profile instance from API response data."""
-        return cls(
-            profile_id=data.get("profileId", ""),
-            profile_name=data.get("profileName", ""),
-            default_profile=data.get("defaultProfile", False),
-        )
+        return cls._build(data)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class AuthorisationPeriod(BaseModel):
     """Period for authorization of payments."""
 
     id: str
     description: str
 
+    _FIELDS = (
+        ("id", "id", ""),
+        ("description", "description", ""),
+    )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AuthorisationPeriod":
         """Create an AuthorisationPeriod instance from API response data."""
-        return cls(
-            id=data.get("id", ""),
-            description=data.get("description", ""),
-        )
+        return cls._build(data)
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class Authoriser(BaseModel):
     """Authoriser information for payments requiring authorization."""
 
     authoriser_id: str
     name: str
 
+    _FIELDS = (
+        ("authoriser_id", "authoriserId", ""),
+        ("name", "name", ""),
+    )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Authoriser":
         """Create an Authoriser instance from API response data."""
-        return cls(
-            authoriser_id=data.get("authoriserId", ""),
-            name=data.get("name", ""),
-        )
+        return cls._build(data)
 
 
+@dataclass(slots=True, kw_only=True)
 class AuthorisationSetup(BaseModel):
     """Authorisation setup information for an account."""
 
@@ -63,23 +74,17 @@ class AuthorisationSetup(BaseModel):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "AuthorisationSetup":
         """Create an AuthorisationSetup instance from API response data."""
-        periods: List[AuthorisationPeriod] = []
-        for period_data in data.get("period", []):
-            periods.append(AuthorisationPeriod.from_dict(period_data))
-
-        authorisers_a: List[Authoriser] = []
-        for auth_data in data.get("authorisersListA", []):
-            authorisers_a.append(Authoriser.from_dict(auth_data))
-
-        authorisers_b: List[Authoriser] = []
-        for auth_data in data.get("authorisersListB", []):
-            authorisers_b.append(Authoriser.from_dict(auth_data))
-
+        period_from_dict = AuthorisationPeriod.from_dict
+        authoriser_from_dict = Authoriser.from_dict
         return cls(
             number_of_authorisation_required=data.get(
                 "numberOfAuthorisationRequired", ""
             ),
-            period=periods,
-            authorisers_list_a=authorisers_a,
-            authorisers_list_b=authorisers_b,
+            period=[period_from_dict(item) for item in data.get("period", ())],
+            authorisers_list_a=[
+                authoriser_from_dict(item) for item in data.get("authorisersListA", ())
+            ],
+            authorisers_list_b=[
+                authoriser_from_dict(item) for item in data.get("authorisersListB", ())
+            ],
         )
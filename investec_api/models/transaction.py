@@ -1,27 +1,64 @@
 """Transaction models for the Investec API."""
 
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
-from enum import Enum
-from typing import Optional
+from enum import StrEnum
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Mapping, Optional
 
-from investec_api.models.base import BaseModel
+from investec_api.models.base import BaseModel, _intern, _to_decimal
 
+if TYPE_CHECKING:
+    from investec_api.models._fast import TransactionStruct
 
-class TransactionType(str, Enum):
+
+@lru_cache(maxsize=4096)
+def _parse_iso(value: str) -> datetime:
+    """Parse an ISO date/datetime string, caching repeats within a response."""
+    return datetime.fromisoformat(value)
+
+
+# (API key, attribute) pairs for the optional date fields of a Transaction
+_DATE_FIELDS = (
+    ("postingDate", "posting_date"),
+    ("valueDate", "value_date"),
+    ("actionDate", "action_date"),
+    ("transactionDate", "transaction_date"),
+)
+
+
+class TransactionType(StrEnum):
     """Type of transaction (credit or debit)."""
 
     CREDIT = "CREDIT"
     DEBIT = "DEBIT"
 
 
-class TransactionStatus(str, Enum):
+class TransactionStatus(StrEnum):
     """Status of transaction (posted or pending)."""
 
     POSTED = "POSTED"
     PENDING = "PENDING"
 
 
+# Enum members keyed by name, which matches the API value, for dict lookups
+_TRANSACTION_TYPES = TransactionType.__members__
+_TRANSACTION_STATUSES = TransactionStatus.__members__
+
+
+def _lookup(members: Mapping[str, Any], value: Optional[str], default: Any) -> Any:
+    """Map an API value to its enum member.
+
+    Only a missing or null value takes the default; values the enum doesn't
+    know are kept as the API's string rather than guessed at.
+    """
+    if value is None:
+        return default
+    return members.get(value, value)
+
+
+@dataclass(slots=True, kw_only=True)
 class Transaction(BaseModel):
     """Transaction information for an Investec bank account."""
 
@@ -40,62 +77,75 @@ class Transaction(BaseModel):
     running_balance: Optional[Decimal] = None
     uuid: Optional[str] = None
 
+    _FIELDS = (
+        ("account_id", "accountId", ""),
+        ("transaction_type", "transactionType", None),
+        ("description", "description", ""),
+        ("card_number", "cardNumber", None),
+        ("posted_order", "postedOrder", None),
+        ("uuid", "uuid", None),
+    )
+    _INTERNED = frozenset({"account_id", "transaction_type", "card_number"})
+
     @classmethod
     def from_dict(cls, data: dict) -> "Transaction":
         """Create a Transaction instance from API response data."""
         # Convert string dates to datetime objects if present
-        posting_date = None
-        if "postingDate" in data and data["postingDate"]:
-            try:
-                posting_date = datetime.fromisoformat(data["postingDate"])
-            except (ValueError, TypeError):
-                pass
-
-        value_date = None
-        if "valueDate" in data and data["valueDate"]:
-            try:
-                value_date = datetime.fromisoformat(data["valueDate"])
-            except (ValueError, TypeError):
-                pass
-
-        action_date = None
-        if "actionDate" in data and data["actionDate"]:
-            try:
-                action_date = datetime.fromisoformat(data["actionDate"])
-            except (ValueError, TypeError):
-                pass
-
-        transaction_date = None
-        if "transactionDate" in data and data["transactionDate"]:
-            try:
-                transaction_date = datetime.fromisoformat(data["transactionDate"])
-            except (ValueError, TypeError):
-                pass
+        dates = {}
+        for key, attr in _DATE_FIELDS:
+            value = data.get(key)
+            if value:
+                try:
+                    dates[attr] = _parse_iso(value)
+                except (ValueError, TypeError):
+                    pass
 
         # Convert numeric fields
-        amount = Decimal(str(data.get("amount", 0)))
-        running_balance = None
-        if "runningBalance" in data and data["runningBalance"] is not None:
-            running_balance = Decimal(str(data["runningBalance"]))
+        running_balance = data.get("runningBalance")
+        if running_balance is not None:
+            running_balance = _to_decimal(running_balance)
+
+        return cls._build(
+            data,
+            type=_lookup(_TRANSACTION_TYPES, data.get("type"), TransactionType.DEBIT),
+            status=_lookup(
+                _TRANSACTION_STATUSES, data.get("status"), TransactionStatus.POSTED
+            ),
+            amount=_to_decimal(data.get("amount", 0)),
+            running_balance=running_balance,
+            **dates,
+        )
+
+    @classmethod
+    def from_struct(cls, struct: "TransactionStruct") -> "Transaction":
+        """Create a Transaction instance from a decoded TransactionStruct."""
+        dates = {}
+        for _, attr in _DATE_FIELDS:
+            value = getattr(struct, attr)
+            if value:
+                try:
+                    dates[attr] = _parse_iso(value)
+                except ValueError:
+                    pass
 
         return cls(
-            account_id=data.get("accountId", ""),
-            type=data.get("type", TransactionType.DEBIT),
-            transaction_type=data.get("transactionType"),
-            status=data.get("status", TransactionStatus.POSTED),
-            description=data.get("description", ""),
-            card_number=data.get("cardNumber"),
-            posted_order=data.get("postedOrder"),
-            posting_date=posting_date,
-            value_date=value_date,
-            action_date=action_date,
-            transaction_date=transaction_date,
-            amount=amount,
-            running_balance=running_balance,
-            uuid=data.get("uuid"),
+            account_id=_intern(struct.account_id),
+            type=_lookup(_TRANSACTION_TYPES, struct.type, TransactionType.DEBIT),
+            transaction_type=_intern(struct.transaction_type),
+            status=_lookup(
+                _TRANSACTION_STATUSES, struct.status, TransactionStatus.POSTED
+            ),
+            description=struct.description,
+            card_number=_intern(struct.card_number),
+            posted_order=struct.posted_order,
+            amount=struct.amount,
+            running_balance=struct.running_balance,
+            uuid=struct.uuid,
+            **dates,
         )
 
 
+@dataclass(slots=True, kw_only=True)
 class PendingTransaction(BaseModel):
     """Pending transaction information for an Investec bank account."""
 
@@ -106,6 +156,11 @@ class PendingTransaction(BaseModel):
     transaction_date: Optional[datetime] = None
     amount: Decimal
 
+    _FIELDS = (
+        ("account_id", "accountId", ""),
+        ("description", "description", ""),
+    )
+
     @classmethod
     def from_dict(cls, data: dict) -> "PendingTransaction":
         """Create a PendingTransaction instance from API response data."""
@@ -113,18 +168,14 @@ class PendingTransaction(BaseModel):
         transaction_date = None
         if "transactionDate" in data and data["transactionDate"]:
             try:
-                transaction_date = datetime.fromisoformat(data["transactionDate"])
+                transaction_date = _parse_iso(data["transactionDate"])
             except (ValueError, TypeError):
                 pass
 
-        # Convert numeric fields
-        amount = Decimal(str(data.get("amount", 0)))
-
-        return cls(
-            account_id=data.get("accountId", ""),
-            type=data.get("type", TransactionType.DEBIT),
+        return cls._build(
+            data,
+            type=_lookup(_TRANSACTION_TYPES, data.get("type"), TransactionType.DEBIT),
             status=TransactionStatus.PENDING,
-            description=data.get("description", ""),
             transaction_date=transaction_date,
-            amount=amount,
+            amount=_to_decimal(data.get("amount", 0)),
         )
@@ -1,11 +1,13 @@
 """Transfer models for the Investec API."""
 
+from dataclasses import dataclass
 from decimal import Decimal
 from typing import Any, Dict, List, Optional
 
-from investec_api.models.base import BaseModel
+from investec_api.models.base import BaseModel, _format_amount, _to_cents
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class TransferItem(BaseModel):
     """Individual transfer item for inter-account transfers."""
 
@@ -14,11 +16,21 @@ class TransferItem(BaseModel):
     my_reference: str
     their_reference: str
 
+    _FIELDS = (
+        ("beneficiary_account_id", "beneficiaryAccountId", ""),
+        ("my_reference", "myReference", ""),
+        ("their_reference", "theirReference", ""),
+    )
+
+    def __post_init__(self) -> None:
+        """Reject amounts that would need rounding to whole cents."""
+        _to_cents(self.amount)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to API-compatible dictionary."""
         return {
             "beneficiaryAccountId": self.beneficiary_account_id,
-            "amount": str(self.amount),
+            "amount": _format_amount(self.amount),
             "myReference": self.my_reference,
             "theirReference": self.their_reference,
         }
@@ -26,14 +38,10 @@ class TransferItem(BaseModel):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TransferItem":
         """Create a TransferItem instance from dictionary data."""
-        return cls(
-            beneficiary_account_id=data.get("beneficiaryAccountId", ""),
-            amount=Decimal(str(data.get("amount", 0))),
-            my_reference=data.get("myReference", ""),
-            their_reference=data.get("theirReference", ""),
-        )
+        return cls._build(data, amount=_to_cents(data.get("amount", 0)))
 
 
+@dataclass(slots=True, kw_only=True)
 class TransferRequest(BaseModel):
     """Request model for inter-account transfers."""
 
@@ -50,6 +58,7 @@ class TransferRequest(BaseModel):
         return result
 
 
+@dataclass(slots=True, frozen=True, kw_only=True)
 class TransferResponseItem(BaseModel):
     """Individual transfer response for inter-account transfers."""
 
@@ -60,19 +69,22 @@ class TransferResponseItem(BaseModel):
     beneficiary_account_id: Optional[str] = None
     authorisation_required: bool = False
 
+    _FIELDS = (
+        ("payment_reference_number", "PaymentReferenceNumber", None),
+        ("payment_date", "PaymentDate", None),
+        ("status", "Status", None),
+        ("beneficiary_name", "BeneficiaryName", None),
+        ("beneficiary_account_id", "BeneficiaryAccountId", None),
+        ("authorisation_required", "AuthorisationRequired", False),
+    )
+
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TransferResponseItem":
         """Create a TransferResponseItem instance from API response data."""
-        return cls(
-            payment_reference_number=data.get("PaymentReferenceNumber"),
-            payment_date=data.get("PaymentDate"),
-            status=data.get("Status"),
-            beneficiary_name=data.get("BeneficiaryName"),
-            beneficiary_account_id=data.get("BeneficiaryAccountId"),
-            authorisation_required=data.get("AuthorisationRequired", False),
-        )
+        return cls._build(data)
 
 
+@dataclass(slots=True, kw_only=True)
 class TransferResponse(BaseModel):
     """Response model for inter-account transfers."""
 
@@ -82,28 +94,13 @@ class TransferResponse(BaseModel):
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "TransferResponse":
         """Create a TransferResponse instance from API response data."""
-        transfer_responses = []
-
-        # Handle both v1 and v2 API response formats
-        responses = []
-        if (
-            "transferResponse" in data
-            and "TransferResponses" in data["transferResponse"]
-        ):
-            responses = data["transferResponse"]["TransferResponses"]
-        elif "TransferResponses" in data:
-            responses = data["TransferResponses"]
-
-        for item in responses:
-            transfer_responses.append(TransferResponseItem.from_dict(item))
-
-        error_message = None
-        if "transferResponse" in data and "ErrorMessage" in data["transferResponse"]:
-            error_message = data["transferResponse"]["ErrorMessage"]
-        elif "ErrorMessage" in data:
-            error_message = data["ErrorMessage"]
-
+        # Handle both v1 and v2 API response formats: v2 nests the payload
+        # under "transferResponse"
+        inner = data.get("transferResponse") or data
+        item_from_dict = TransferResponseItem.from_dict
         return cls(
-            transfer_responses=transfer_responses,
-            error_message=error_message,
+            transfer_responses=[
+                item_from_dict(item) for item in inner.get("TransferResponses", ())
+            ],
+            error_message=inner.get("ErrorMessage"),
         )
@@ -4,13 +4,38 @@ Investec API MCP Server
 This server provides MCP tools to interact with the Investec API.
 """
 
+import asyncio
+import functools
 import logging
-from datetime import date, datetime
-from typing import Any, Dict, Optional, Union
+import sys
+import time
+from contextlib import asynccontextmanager
+from string import Formatter
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+import msgspec
 
 # Import our configuration
 from config import config
 from investec_api.client import InvestecClient
+from investec_api.exceptions import InvestecRateLimitError
+from investec_api.models.account import Account, AccountBalance
+from investec_api.models.beneficiary import Beneficiary, BeneficiaryCategory
+from investec_api.models.payment import BeneficiaryPaymentItem
+from investec_api.models.profile import Profile
+from investec_api.models.transaction import PendingTransaction, Transaction
+from investec_api.models.transfer import TransferItem
 
 # Configure logging
 logging.basicConfig(
@@ -26,12 +51,9 @@ except ImportError:
     logger.error(
         "Error: MCP package not found. Please install it with 'uv pip install \"mcp[cli]\"'"
     )
-    exit(1)
-
-# Initialize FastMCP server
-mcp = FastMCP("investec")
+    sys.exit(1)
 
-# Initialize the Investec client
+# Initialize the Investec client, shared by all tools for the server's lifetime
 client = InvestecClient(
     client_id=config.client_id,
     client_secret=config.client_secret,
@@ -40,48 +62,424 @@ client = InvestecClient(
     timeout=config.timeout,
 )
 
+
+@asynccontextmanager
+async def lifespan(server: "FastMCP") -> AsyncIterator[None]:
+    """Keep the client's pooled connections open while the server runs."""
+    warm_up = asyncio.ensure_future(warm_cache()) if config.cache_ttl > 0 else None
+    try:
+        yield
+    finally:
+        if warm_up is not None:
+            warm_up.cancel()
+        client.close()
+
+
+# Initialize FastMCP server
+mcp = FastMCP("investec", lifespan=lifespan)
+
 # Log configuration values at debug level with sensitive data masked
-logger.debug(
-    "Configuration: client_id=%s, client_secret=%s, api_key=%s, use_sandbox=%s, timeout=%s",
-    f"{config.client_id[:4]}..." if config.client_id else "Not set",
-    "***" if config.client_secret else "Not set",
-    "***" if config.api_key else "Not set",
-    config.use_sandbox,
-    config.timeout,
-)
+if logger.isEnabledFor(logging.DEBUG):
+    logger.debug(
+        "Configuration: client_id=%s, client_secret=%s, api_key=%s, use_sandbox=%s, timeout=%s",
+        f"{config.client_id[:4]}..." if config.client_id else "Not set",
+        "***" if config.client_secret else "Not set",
+        "***" if config.api_key else "Not set",
+        config.use_sandbox,
+        config.timeout,
+    )
+
+
+T = TypeVar("T")
+
+# Decoders for the transfer and payment tool arguments. They validate the
+# JSON and build the request items in one pass; amounts given as strings or
+# numbers are decoded straight to Decimal.
+decode_transfers = msgspec.json.Decoder(List[TransferItem]).decode
+decode_payments = msgspec.json.Decoder(List[BeneficiaryPaymentItem]).decode
+
+# Most transactions listed by get_account_transactions
+MAX_TRANSACTIONS = 10
 
+# Largest number of items sent in one transfer or payment request
+MAX_BATCH_SIZE = 100
 
-# Helper function to format dates properly
-def format_date(date_value: Union[str, date, datetime]) -> str:
-    """Format date to a human-readable string."""
-    if isinstance(date_value, str):
-        return date_value
-    return date_value.strftime("%Y-%m-%d")
+
+def batched(items: List[T], size: int = MAX_BATCH_SIZE) -> List[List[T]]:
+    """Split a list into consecutive chunks of at most ``size`` items."""
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+class AsyncTokenBucket:
+    """Token-bucket rate limiter for outbound API calls.
+
+    Holds up to ``capacity`` tokens, refilled at ``refill_rate`` tokens per
+    second. Callers wait for a token instead of bursting past the API's
+    rate limit and collecting 429 responses.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float) -> None:
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate
+        )
+        self.last_refill = now
+
+    async def acquire(self, n: float = 1) -> None:
+        """Wait until ``n`` tokens are available, then take them."""
+        async with self._lock:
+            self._refill()
+            if self.tokens < n:
+                await asyncio.sleep((n - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= n
+
+    def penalize(self) -> None:
+        """Back off after a 429 by pushing the bucket into debt."""
+        self._refill()
+        self.tokens = min(-1, self.tokens - self.refill_rate)
+
+
+# Separate budgets for reads and for money-moving writes
+read_bucket = AsyncTokenBucket(capacity=10, refill_rate=5)
+write_bucket = AsyncTokenBucket(capacity=2, refill_rate=1)
+
+
+async def call_api(
+    bucket: AsyncTokenBucket, func: Callable[..., T], *args: Any, **kwargs: Any
+) -> T:
+    """Call a client method once the bucket allows it.
+
+    The client is synchronous, so the call runs in a worker thread to keep
+    the event loop free for other tool calls while it waits on the API.
+    """
+    await bucket.acquire()
+    try:
+        return await asyncio.to_thread(func, *args, **kwargs)
+    except InvestecRateLimitError:
+        bucket.penalize()
+        raise
+
+
+# Results of read-only lookups, keyed by (function name, arguments), along
+# with the lookups currently in flight so concurrent callers share one fetch.
+# clear_cache() bumps the generation so fetches started before a write
+# don't store their now-stale results.
+_CACHE_MAXSIZE = 256
+_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+_inflight: Dict[Tuple[Any, ...], "asyncio.Task[Any]"] = {}
+_generation = 0
+
+
+def _lookup_key(
+    func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Tuple[Any, ...]:
+    return (func.__name__, args, tuple(sorted(kwargs.items())))
+
+
+def _shared_fetch(
+    key: Tuple[Any, ...],
+    func: Callable[..., Awaitable[T]],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    ttl: float = 0,
+) -> "asyncio.Task[T]":
+    """Get the in-flight fetch for ``key``, starting one if none is running.
+
+    With a positive ``ttl`` a successful result is also cached for that
+    many seconds.
+    """
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(func(*args, **kwargs))
+        _inflight[key] = task
+        generation = _generation
+
+        def done(finished: "asyncio.Task[Any]") -> None:
+            if _inflight.get(key) is finished:
+                del _inflight[key]
+            if finished.cancelled():
+                return
+            # Always retrieve the exception, so a failure nobody is still
+            # waiting on isn't logged as "never retrieved"
+            error = finished.exception()
+            if ttl > 0 and error is None and generation == _generation:
+                if len(_cache) >= _CACHE_MAXSIZE:
+                    _cache.pop(next(iter(_cache)))
+                _cache[key] = (time.monotonic() + ttl, finished.result())
+
+        task.add_done_callback(done)
+    return task
+
+
+def single_flight(
+    func: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """Share one upstream call among concurrent calls with the same arguments.
+
+    Only for idempotent reads; never for transfers or payments.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        task = _shared_fetch(_lookup_key(func, args, kwargs), func, args, kwargs)
+        # Shield the shared fetch so one caller's cancellation doesn't
+        # cancel it for everyone else waiting on it
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+def ttl_cached(
+    func: Callable[..., Awaitable[T]],
+) -> Callable[..., Awaitable[T]]:
+    """Cache an async lookup's result for ``config.cache_ttl`` seconds.
+
+    Concurrent calls with the same arguments wait on a single upstream
+    fetch, even with caching disabled. Failed lookups are not cached.
+    """
+
+    @functools.wraps(func)
+    async def wrapper(*args: Any, **kwargs: Any) -> T:
+        key = _lookup_key(func, args, kwargs)
+        ttl = config.cache_ttl
+        if ttl > 0:
+            entry = _cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+
+        task = _shared_fetch(key, func, args, kwargs, ttl)
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+def clear_cache() -> None:
+    """Drop all cached lookups, e.g. after a transfer or payment.
+
+    Lookups still in flight finish for their current callers, but later
+    callers start a fresh fetch and the stale results are not cached.
+    """
+    global _generation
+    _generation += 1
+    _cache.clear()
+    _inflight.clear()
+
+
+async def send_batches(
+    send: Callable[[List[T]], Awaitable[Any]], items: List[T]
+) -> Tuple[List[Any], Optional[Exception], int]:
+    """Send ``items`` in batches, one request at a time.
+
+    Stops at the first failed batch so nothing after it is sent, and
+    clears the lookup cache if any batch went through.
+
+    Returns:
+        The responses of the batches that succeeded, the error that stopped
+        the run (or None), and the number of items in the batches that
+        succeeded.
+    """
+    responses: List[Any] = []
+    sent = 0
+    try:
+        for batch in batched(items):
+            responses.append(await send(batch))
+            sent += len(batch)
+    except Exception as e:
+        return responses, e, sent
+    finally:
+        if responses:
+            clear_cache()
+    return responses, None, sent
+
+
+def _item_range(first: int, last: int) -> str:
+    return str(first) if first == last else f"{first}-{last}"
+
+
+def format_failed_batch(label: str, sent: int, total: int) -> str:
+    """Describe the items affected by a failed batch, numbered from 1.
+
+    A timeout or server error can arrive after the bank has executed the
+    failed batch, so its outcome is reported as unknown. Only the batches
+    after it are reported as not sent.
+    """
+    failed_end = min(sent + MAX_BATCH_SIZE, total)
+    lines = [
+        f"Outcome unknown: {label} {_item_range(sent + 1, failed_end)} of {total}"
+        " — check transactions before retrying."
+    ]
+    if failed_end < total:
+        lines.append(
+            f"Not sent: {label} {_item_range(failed_end + 1, total)} of {total}."
+        )
+    return "\n".join(lines)
 
 
-# Helper function for account details
-def format_account(account: Dict[str, Any]) -> str:
-    """Format account information into a readable string."""
-    return f"""
-Account Name: {account.get("account_name", "Unknown")}
-Account Number: {account.get("account_number", "Unknown")}
-Account Type: {account.get("product_name", "Unknown")}
-Current Balance: {account.get("current_balance", 0)} {account.get("currency_code", "")}
-Available Balance: {account.get("available_balance", 0)} {account.get("currency_code", "")}
+@ttl_cached
+async def _fetch_accounts() -> List[Account]:
+    """Get all accounts, cached."""
+    return await call_api(read_bucket, client.get_accounts)
+
+
+@ttl_cached
+async def _fetch_beneficiaries() -> List[Beneficiary]:
+    """Get all beneficiaries, cached."""
+    return await call_api(read_bucket, client.get_beneficiaries)
+
+
+@ttl_cached
+async def _fetch_beneficiary_categories() -> BeneficiaryCategory:
+    """Get beneficiary categories, cached."""
+    return await call_api(read_bucket, client.get_beneficiary_categories)
+
+
+@ttl_cached
+async def _fetch_profiles() -> List[Profile]:
+    """Get all profiles, cached."""
+    return await call_api(read_bucket, client.get_profiles)
+
+
+@ttl_cached
+async def _fetch_profile_accounts(profile_id: str) -> List[Account]:
+    """Get the accounts for a profile, cached."""
+    return await call_api(read_bucket, client.get_profile_accounts, profile_id)
+
+
+@single_flight
+async def _fetch_account_balance(account_id: str) -> AccountBalance:
+    """Get an account's balance, sharing concurrent identical requests."""
+    return await call_api(read_bucket, client.get_account_balance, account_id)
+
+
+@single_flight
+async def _fetch_account_transactions(
+    account_id: str, **filters: Any
+) -> List[Transaction]:
+    """Get an account's transactions, sharing concurrent identical requests."""
+    return await call_api(
+        read_bucket, client.get_account_transactions, account_id, **filters
+    )
+
+
+@single_flight
+async def _fetch_pending_transactions(account_id: str) -> List[PendingTransaction]:
+    """Get pending transactions, sharing concurrent identical requests."""
+    return await call_api(
+        read_bucket, client.get_account_pending_transactions, account_id
+    )
+
+
+async def warm_cache() -> None:
+    """Prefetch the accounts and profiles most conversations start with.
+
+    The two lookups are independent, so they are fetched concurrently.
+    Failures are left for the tools to report when actually called.
+    """
+    results = await asyncio.gather(
+        _fetch_accounts(), _fetch_profiles(), return_exceptions=True
+    )
+    for result in results:
+        if isinstance(result, Exception):
+            logger.debug("Cache warm-up failed: %s", result)
+
+
+# Output templates, filled from model dictionaries with str.format_map
+ACCOUNT_TEMPLATE = """
+Account Name: {account_name}
+Account Number: {account_number}
+Account Type: {product_name}
+Current Balance: {current_balance} {currency_code}
+Available Balance: {available_balance} {currency_code}
+"""
+
+BALANCE_TEMPLATE = """
+Current Balance: {current_balance} {currency_code}
+Available Balance: {available_balance} {currency_code}
 """
 
+TRANSACTION_TEMPLATE = """
+Date: {transaction_date}
+Description: {description}
+Amount: {amount} {currency_code}
+Type: {transaction_type}
+Status: {status}
+"""
+
+BENEFICIARY_TEMPLATE = """
+Beneficiary ID: {beneficiary_id}
+Name: {name}
+Account Number: {account_number}
+Bank: {bank_name}
+Type: {beneficiary_type}
+Status: {status}
+Last Payment Amount: {last_payment_amount}
+Last Payment Date: {last_payment_date}
+"""
+
+CATEGORY_TEMPLATE = """
+ID: {id}
+Name: {name}
+Is Default: {is_default}
+"""
+
+PAYMENT_RESPONSE_TEMPLATE = """
+Payment Reference: {payment_reference_number}
+Payment Date: {payment_date}
+Status: {status}
+Beneficiary Name: {beneficiary_name}
+Beneficiary Account ID: {beneficiary_account_id}
+Authorisation Required: {authorisation_required}
+"""
 
-# Helper function for transaction details
-def format_transaction(transaction: Dict[str, Any]) -> str:
-    """Format transaction information into a readable string."""
-    return f"""
-Date: {transaction.get("transaction_date", "Unknown")}
-Description: {transaction.get("description", "Unknown")}
-Amount: {transaction.get("amount", 0)} {transaction.get("currency_code", "")}
-Type: {transaction.get("transaction_type", "Unknown")}
-Status: {transaction.get("status", "Unknown")}
+PROFILE_TEMPLATE = """
+Profile ID: {profile_id}
+Profile Name: {profile_name}
+Profile Type: {profile_type}
 """
 
+RECORD_SEPARATOR = "\n---\n"
+
+# Placeholder values for fields missing from a record; anything not listed
+# is shown as "Unknown"
+_FIELD_DEFAULTS: Dict[str, Any] = {
+    "current_balance": 0,
+    "available_balance": 0,
+    "amount": 0,
+    "currency_code": "",
+    "authorisation_required": False,
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _template_defaults(template: str) -> Dict[str, Any]:
+    """Get the placeholder value for every field a template uses."""
+    return {
+        field: _FIELD_DEFAULTS.get(field, "Unknown")
+        for _, field, _, _ in Formatter().parse(template)
+        if field
+    }
+
+
+def format_record(template: str, record: Dict[str, Any]) -> str:
+    """Fill an output template from a record, defaulting missing fields."""
+    return template.format_map({**_template_defaults(template), **record})
+
+
+def format_records(template: str, records: Iterable[Any]) -> str:
+    """Format model instances with a template, separated by ``---`` lines."""
+    defaults = _template_defaults(template)
+    return RECORD_SEPARATOR.join(
+        [template.format_map({**defaults, **record.to_dict()}) for record in records]
+    )
+
 
 # MCP Tools
 
@@ -90,16 +488,11 @@ Status: {transaction.get("status", "Unknown")}
 async def get_accounts() -> str:
     """Get all accounts for the authenticated user."""
     try:
-        accounts = client.get_accounts()
+        accounts = await _fetch_accounts()
         if not accounts:
             return "No accounts found."
 
-        account_info = []
-        for account in accounts:
-            account_dict = account.to_dict()
-            account_info.append(format_account(account_dict))
-
-        return "\n---\n".join(account_info)
+        return format_records(ACCOUNT_TEMPLATE, accounts)
     except Exception as e:
         return f"Error retrieving accounts: {str(e)}"
 
@@ -112,13 +505,8 @@ async def get_account_balance(account_id: str) -> str:
         account_id: The ID of the account
     """
     try:
-        balance = client.get_account_balance(account_id)
-        balance_dict = balance.to_dict()
-
-        return f"""
-Current Balance: {balance_dict.get("current_balance", 0)} {balance_dict.get("currency_code", "")}
-Available Balance: {balance_dict.get("available_balance", 0)} {balance_dict.get("currency_code", "")}
-"""
+        balance = await _fetch_account_balance(account_id)
+        return format_record(BALANCE_TEMPLATE, balance.to_dict())
     except Exception as e:
         return f"Error retrieving account balance: {str(e)}"
 
@@ -139,25 +527,25 @@ async def get_account_transactions(
         transaction_type: Filter transactions by type
     """
     try:
-        transactions = client.get_account_transactions(
+        transactions = await _fetch_account_transactions(
             account_id,
             from_date=from_date,
             to_date=to_date,
             transaction_type=transaction_type,
+            # One extra to tell whether the list was truncated
+            limit=MAX_TRANSACTIONS + 1,
         )
 
         if not transactions:
             return "No transactions found for the specified criteria."
 
-        transaction_info = []
-        for transaction in transactions[:10]:  # Limit to 10 transactions
-            transaction_dict = transaction.to_dict()
-            transaction_info.append(format_transaction(transaction_dict))
+        result = format_records(TRANSACTION_TEMPLATE, transactions[:MAX_TRANSACTIONS])
 
-        result = "\n---\n".join(transaction_info)
-
-        if len(transactions) > 10:
-            result += f"\n\nShowing 10 of {len(transactions)} transactions."
+        if len(transactions) > MAX_TRANSACTIONS:
+            result += (
+                f"\n\nShowing the first {MAX_TRANSACTIONS} transactions. "
+                "Narrow the date range to see others."
+            )
 
         return result
     except Exception as e:
@@ -172,17 +560,12 @@ async def get_pending_transactions(account_id: str) -> str:
         account_id: The ID of the account
     """
     try:
-        pending = client.get_account_pending_transactions(account_id)
+        pending = await _fetch_pending_transactions(account_id)
 
         if not pending:
             return "No pending transactions found."
 
-        pending_info = []
-        for transaction in pending:
-            transaction_dict = transaction.to_dict()
-            pending_info.append(format_transaction(transaction_dict))
-
-        return "\n---\n".join(pending_info)
+        return format_records(TRANSACTION_TEMPLATE, pending)
     except Exception as e:
         return f"Error retrieving pending transactions: {str(e)}"
 
@@ -191,26 +574,12 @@ async def get_pending_transactions(account_id: str) -> str:
 async def get_beneficiaries() -> str:
     """Get all beneficiaries for the authenticated user."""
     try:
-        beneficiaries = client.get_beneficiaries()
+        beneficiaries = await _fetch_beneficiaries()
 
         if not beneficiaries:
             return "No beneficiaries found."
 
-        beneficiary_info = []
-        for beneficiary in beneficiaries:
-            beneficiary_dict = beneficiary.to_dict()
-            beneficiary_info.append(f"""
-Beneficiary ID: {beneficiary_dict.get("beneficiary_id", "Unknown")}
-Name: {beneficiary_dict.get("name", "Unknown")}
-Account Number: {beneficiary_dict.get("account_number", "Unknown")}
-Bank: {beneficiary_dict.get("bank_name", "Unknown")}
-Type: {beneficiary_dict.get("beneficiary_type", "Unknown")}
-Status: {beneficiary_dict.get("status", "Unknown")}
-Last Payment Amount: {beneficiary_dict.get("last_payment_amount", "Unknown")}
-Last Payment Date: {beneficiary_dict.get("last_payment_date", "Unknown")}
-""")
-
-        return "\n---\n".join(beneficiary_info)
+        return format_records(BENEFICIARY_TEMPLATE, beneficiaries)
     except Exception as e:
         return f"Error retrieving beneficiaries: {str(e)}"
 
@@ -219,17 +588,13 @@ Last Payment Date: {beneficiary_dict.get("last_payment_date", "Unknown")}
 async def get_beneficiary_categories() -> str:
     """Get beneficiary categories available to the authenticated user."""
     try:
-        categories = client.get_beneficiary_categories()
+        categories = await _fetch_beneficiary_categories()
         categories_dict = categories.to_dict()
 
         if not categories_dict:
             return "No beneficiary categories found."
 
-        return f"""
-ID: {categories_dict.get("id", "Unknown")}
-Name: {categories_dict.get("name", "Unknown")}
-Is Default: {categories_dict.get("is_default", "Unknown")}
-"""
+        return format_record(CATEGORY_TEMPLATE, categories_dict)
     except Exception as e:
         return f"Error retrieving beneficiary categories: {str(e)}"
 
@@ -250,47 +615,43 @@ async def transfer_multiple(
                     "my_reference": "My Ref",
                     "their_reference": "Their Ref"}]
         profile_id: Optional profile ID
+
+    Pass every transfer in a single call rather than calling this tool once
+    per transfer; lists longer than 100 are sent in batches of 100, one
+    after another. If a batch fails, later batches are not sent. The reply
+    marks the failed batch's transfers as outcome unknown, since the bank may
+    have executed them; check transactions before retrying those.
     """
     try:
-        import json
-
-        from investec_api.models.transfer import TransferItem
-
-        # Parse the transfers JSON string into a list of dictionaries
-        transfer_dicts = json.loads(transfers)
-
-        # Convert the dictionaries to TransferItem objects
-        transfer_items = []
-        for transfer in transfer_dicts:
-            transfer_item = TransferItem(
-                beneficiary_account_id=transfer.get("beneficiary_account_id"),
-                amount=transfer.get("amount"),
-                my_reference=transfer.get("my_reference"),
-                their_reference=transfer.get("their_reference"),
+        # Parse the transfers JSON string into TransferItem objects
+        transfer_items = decode_transfers(transfers)
+
+        # Execute the transfers, one request per batch
+        responses, error, sent = await send_batches(
+            lambda batch: call_api(
+                write_bucket, client.transfer_multiple, account_id, batch, profile_id
+            ),
+            transfer_items,
+        )
+        if error is not None:
+            failure = f"Error executing transfers: {error}\n" + format_failed_batch(
+                "transfers", sent, len(transfer_items)
             )
-            transfer_items.append(transfer_item)
-
-        # Execute the transfer
-        response = client.transfer_multiple(account_id, transfer_items, profile_id)
-        response_dict = response.to_dict()
+            if not responses:
+                return failure
 
         # Format the response
-        transfer_responses = response_dict.get("transfer_responses", [])
-        if not transfer_responses:
-            return "No transfer responses received."
-
-        result = []
-        for resp in transfer_responses:
-            result.append(f"""
-Payment Reference: {resp.get("payment_reference_number", "Unknown")}
-Payment Date: {resp.get("payment_date", "Unknown")}
-Status: {resp.get("status", "Unknown")}
-Beneficiary Name: {resp.get("beneficiary_name", "Unknown")}
-Beneficiary Account ID: {resp.get("beneficiary_account_id", "Unknown")}
-Authorisation Required: {resp.get("authorisation_required", False)}
-""")
-
-        return "\n---\n".join(result)
+        transfer_responses = [
+            item for response in responses for item in response.transfer_responses
+        ]
+        if transfer_responses:
+            output = format_records(PAYMENT_RESPONSE_TEMPLATE, transfer_responses)
+        else:
+            output = "No transfer responses received."
+
+        if error is not None:
+            output += f"\n\n{failure}"
+        return output
 
     except Exception as e:
         return f"Error executing transfers: {str(e)}"
@@ -307,47 +668,44 @@ async def pay_beneficiaries(account_id: str, payments: str) -> str:
                    "amount": "10.00",
                    "my_reference": "My Ref",
                    "their_reference": "Their Ref"}]
+
+    Pass every payment in a single call rather than calling this tool once
+    per payment; lists longer than 100 are sent in batches of 100, one
+    after another. If a batch fails, later batches are not sent. The reply
+    marks the failed batch's payments as outcome unknown, since the bank may
+    have executed them; check transactions before retrying those.
     """
     try:
-        import json
-
-        from investec_api.models.payment import BeneficiaryPaymentItem
-
-        # Parse the payments JSON string into a list of dictionaries
-        payment_dicts = json.loads(payments)
-
-        # Convert the dictionaries to BeneficiaryPaymentItem objects
-        payment_items = []
-        for payment in payment_dicts:
-            payment_item = BeneficiaryPaymentItem(
-                beneficiary_id=payment.get("beneficiary_id"),
-                amount=payment.get("amount"),
-                my_reference=payment.get("my_reference"),
-                their_reference=payment.get("their_reference"),
+        # Parse the payments JSON string into BeneficiaryPaymentItem objects
+        payment_items = decode_payments(payments)
+
+        # Execute the payments, one request per batch
+        responses, error, sent = await send_batches(
+            lambda batch: call_api(
+                write_bucket, client.pay_beneficiaries, account_id, batch
+            ),
+            payment_items,
+        )
+        if error is not None:
+            failure = (
+                f"Error making beneficiary payments: {error}\n"
+                + format_failed_batch("payments", sent, len(payment_items))
             )
-            payment_items.append(payment_item)
-
-        # Execute the payment
-        response = client.pay_beneficiaries(account_id, payment_items)
-        response_dict = response.to_dict()
+            if not responses:
+                return failure
 
         # Format the response
-        payment_responses = response_dict.get("payment_responses", [])
-        if not payment_responses:
-            return "No payment responses received."
-
-        result = []
-        for resp in payment_responses:
-            result.append(f"""
-Payment Reference: {resp.get("payment_reference_number", "Unknown")}
-Payment Date: {resp.get("payment_date", "Unknown")}
-Status: {resp.get("status", "Unknown")}
-Beneficiary Name: {resp.get("beneficiary_name", "Unknown")}
-Beneficiary Account ID: {resp.get("beneficiary_account_id", "Unknown")}
-Authorisation Required: {resp.get("authorisation_required", False)}
-""")
-
-        return "\n---\n".join(result)
+        payment_responses = [
+            item for response in responses for item in response.transfer_responses
+        ]
+        if payment_responses:
+            output = format_records(PAYMENT_RESPONSE_TEMPLATE, payment_responses)
+        else:
+            output = "No payment responses received."
+
+        if error is not None:
+            output += f"\n\n{failure}"
+        return output
 
     except Exception as e:
         return f"Error making beneficiary payments: {str(e)}"
@@ -357,21 +715,12 @@ Authorisation Required: {resp.get("authorisation_required", False)}
 async def get_profiles() -> str:
     """Get all profiles for the authenticated user."""
     try:
-        profiles = client.get_profiles()
+        profiles = await _fetch_profiles()
 
         if not profiles:
             return "No profiles found."
 
-        profile_info = []
-        for profile in profiles:
-            profile_dict = profile.to_dict()
-            profile_info.append(f"""
-Profile ID: {profile_dict.get("profile_id", "Unknown")}
-Profile Name: {profile_dict.get("profile_name", "Unknown")}
-Profile Type: {profile_dict.get("profile_type", "Unknown")}
-""")
-
-        return "\n---\n".join(profile_info)
+        return format_records(PROFILE_TEMPLATE, profiles)
     except Exception as e:
         return f"Error retrieving profiles: {str(e)}"
 
@@ -384,17 +733,12 @@ async def get_profile_accounts(profile_id: str) -> str:
         profile_id: The ID of the profile
     """
     try:
-        accounts = client.get_profile_accounts(profile_id)
+        accounts = await _fetch_profile_accounts(profile_id)
 
         if not accounts:
             return "No accounts found for this profile."
 
-        account_info = []
-        for account in accounts:
-            account_dict = account.to_dict()
-            account_info.append(format_account(account_dict))
-
-        return "\n---\n".join(account_info)
+        return format_records(ACCOUNT_TEMPLATE, accounts)
     except Exception as e:
         return f"Error retrieving profile accounts: {str(e)}"
 
@@ -406,7 +750,7 @@ if __name__ == "__main__":
         logger.error(
             "Please set INVESTEC_CLIENT_ID, INVESTEC_CLIENT_SECRET, and INVESTEC_API_KEY."
         )
-        exit(1)
+        sys.exit(1)
 
     # Initialize and run the server
     logger.info("Starting Investec API MCP server")
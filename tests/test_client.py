@@ -0,0 +1,271 @@
+"""Offline tests for InvestecClient internals."""
+
+import json
+import stat
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from investec_api import InvestecClient
+from investec_api.exceptions import InvestecAPIError, InvestecRequestError
+from investec_api.models import Transaction
+
+
+class TestInvestecClient:
+    """Tests for client behaviour that doesn't need the Investec API."""
+
+    @pytest.fixture
+    def client(self) -> Iterator[InvestecClient]:
+        """Create a client that doesn't touch the on-disk token cache."""
+        client = InvestecClient(
+            client_id="client-id",
+            client_secret="client-secret",
+            api_key="api-key",
+            use_sandbox=True,
+            cache_token=False,
+        )
+        yield client
+        client.close()
+
+    def test_concurrent_get_session_creates_one_session(
+        self, client: InvestecClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Threads racing on first use share a single session."""
+        created = []
+        create_session = client._create_session
+
+        def slow_create_session():
+            time.sleep(0.05)
+            session = create_session()
+            created.append(session)
+            return session
+
+        monkeypatch.setattr(client, "_create_session", slow_create_session)
+
+        workers = 8
+        barrier = threading.Barrier(workers)
+
+        def get_session(_: int):
+            barrier.wait()
+            return client._get_session()
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            sessions = list(executor.map(get_session, range(workers)))
+
+        assert len(created) == 1
+        assert all(session is created[0] for session in sessions)
+
+    @pytest.fixture
+    def token_cache_dir(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+        """Point the on-disk token cache at a temporary directory."""
+        cache_dir = tmp_path / "tokens"
+        monkeypatch.setattr(InvestecClient, "TOKEN_CACHE_DIR", cache_dir)
+        return cache_dir
+
+    def _caching_client(self) -> InvestecClient:
+        return InvestecClient(
+            client_id="client-id",
+            client_secret="client-secret",
+            api_key="api-key",
+            use_sandbox=True,
+        )
+
+    def test_token_cache_round_trip(self, token_cache_dir: Path) -> None:
+        """A saved token is private to the user and reused by a new client."""
+        client = self._caching_client()
+        client._access_token = "cached-token"
+        client._token_expires_at = time.time() + 600
+        client._save_cached_token()
+
+        (cache_file,) = token_cache_dir.iterdir()
+        assert stat.S_IMODE(cache_file.stat().st_mode) == 0o600
+
+        reloaded = self._caching_client()
+        assert reloaded._access_token == "cached-token"
+        assert reloaded._auth_headers == {"Authorization": "Bearer cached-token"}
+        assert not reloaded._token_expired()
+
+    def test_token_cache_ignores_expired_token(self, token_cache_dir: Path) -> None:
+        """An expired cached token is not loaded."""
+        client = self._caching_client()
+        client._access_token = "stale-token"
+        client._token_expires_at = time.time() - 1
+        client._save_cached_token()
+
+        reloaded = self._caching_client()
+        assert reloaded._access_token is None
+        assert reloaded._token_expired()
+
+    def test_token_cache_ignores_corrupt_file(self, token_cache_dir: Path) -> None:
+        """An unreadable cache file is treated as no cached token."""
+        client = self._caching_client()
+        token_cache_dir.mkdir(parents=True)
+        client._token_cache_path.write_text("not json")
+
+        reloaded = self._caching_client()
+        assert reloaded._access_token is None
+
+    def test_token_cache_dir_resolved_lazily(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without a home directory the client still works, just uncached."""
+
+        def no_home() -> Path:
+            raise RuntimeError("Could not determine home directory")
+
+        monkeypatch.delenv("XDG_CACHE_HOME", raising=False)
+        monkeypatch.setattr(Path, "home", no_home)
+
+        uncached = InvestecClient(
+            client_id="client-id",
+            client_secret="client-secret",
+            api_key="api-key",
+            cache_token=False,
+        )
+        assert uncached._token_cache_path is None
+
+        homeless = self._caching_client()
+        assert homeless._token_cache_path is None
+
+    def test_token_cache_dir_follows_xdg_cache_home(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """The default cache directory lives under $XDG_CACHE_HOME."""
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+        client = self._caching_client()
+
+        assert client._token_cache_path.parent == tmp_path / "investec-sapb-mcp"
+
+    def _stub_api(
+        self,
+        client: InvestecClient,
+        monkeypatch: pytest.MonkeyPatch,
+        valid_tokens: set,
+    ) -> list:
+        """Stub token refreshes and an API that accepts only ``valid_tokens``."""
+        import requests
+
+        sent_tokens = []
+        new_tokens = iter(["fresh-token", "newer-token"])
+
+        def authenticate() -> None:
+            client._access_token = next(new_tokens)
+            client._token_expires_at = time.time() + 600
+            client._auth_headers = {"Authorization": f"Bearer {client._access_token}"}
+            client._save_cached_token()
+
+        def request(method, url, headers, **kwargs) -> requests.Response:
+            token = headers["Authorization"].removeprefix("Bearer ")
+            sent_tokens.append(token)
+            response = requests.Response()
+            response.url = url
+            response.status_code = 200 if token in valid_tokens else 401
+            response._content = b"{}" if response.status_code == 200 else b""
+            return response
+
+        monkeypatch.setattr(client, "_authenticate", authenticate)
+        monkeypatch.setattr(client._get_session(), "request", request)
+        return sent_tokens
+
+    def test_rejected_cached_token_is_replaced(
+        self, token_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A 401 discards the cached token and retries once with a new one."""
+        stale = self._caching_client()
+        stale._access_token = "revoked-token"
+        stale._token_expires_at = time.time() + 600
+        stale._save_cached_token()
+
+        client = self._caching_client()
+        sent_tokens = self._stub_api(client, monkeypatch, {"fresh-token"})
+
+        assert client._request("GET", "/za/pb/v1/accounts") == {}
+        assert sent_tokens == ["revoked-token", "fresh-token"]
+        (cache_file,) = token_cache_dir.iterdir()
+        assert json.loads(cache_file.read_text())["token"] == "fresh-token"
+        client.close()
+
+    def test_repeated_401_is_not_retried_again(
+        self, token_cache_dir: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """If the new token is rejected too, the 401 is raised."""
+        client = self._caching_client()
+        client._access_token = "revoked-token"
+        client._token_expires_at = time.time() + 600
+        client._auth_headers = {"Authorization": "Bearer revoked-token"}
+        client._save_cached_token()
+        sent_tokens = self._stub_api(client, monkeypatch, set())
+
+        with pytest.raises(InvestecRequestError) as excinfo:
+            client._request("GET", "/za/pb/v1/accounts")
+
+        assert excinfo.value.status_code == 401
+        assert sent_tokens == ["revoked-token", "fresh-token"]
+        client.close()
+
+    def _stub_body(
+        self, client: InvestecClient, monkeypatch: pytest.MonkeyPatch, body: bytes
+    ) -> None:
+        monkeypatch.setattr(client, "_request", lambda *args, **kwargs: body)
+
+    def test_transactions_fall_back_to_dict_parsing(
+        self, client: InvestecClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Rows that don't fit the typed structs are still parsed leniently."""
+        row = {"accountId": "1", "postedOrder": "7", "amount": "10.50"}
+        self._stub_body(
+            client,
+            monkeypatch,
+            b'{"data": {"transactions": ['
+            b'{"accountId": "1", "postedOrder": "7", "amount": "10.50"}]}}',
+        )
+
+        transactions = client.get_account_transactions("1")
+
+        assert transactions == [Transaction.from_dict(row)]
+
+    def test_transactions_empty_body(
+        self, client: InvestecClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """An empty response body yields no transactions."""
+        self._stub_body(client, monkeypatch, b"")
+
+        assert client.get_account_transactions("1") == []
+
+    def test_balance_is_built_from_the_raw_body(
+        self, client: InvestecClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Single-object responses are built with from_json, keeping Decimals."""
+        self._stub_body(
+            client,
+            monkeypatch,
+            b'{"data": {"accountId": "1", "currentBalance": 10.10}}',
+        )
+
+        balance = client.get_account_balance("1")
+
+        assert balance.account_id == "1"
+        assert str(balance.current_balance) == "10.10"
+
+    def test_model_response_invalid_json(
+        self, client: InvestecClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A malformed single-object body is reported as an API error."""
+        self._stub_body(client, monkeypatch, b"{not json")
+
+        with pytest.raises(InvestecAPIError):
+            client.get_account_balance("1")
+
+    def test_transactions_invalid_json(
+        self, client: InvestecClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A malformed body is reported as an API error."""
+        self._stub_body(client, monkeypatch, b"{not json")
+
+        with pytest.raises(InvestecAPIError):
+            client.get_account_transactions("1")
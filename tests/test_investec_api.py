@@ -104,6 +104,18 @@ class TestInvestecAPI:
         assert isinstance(balance.available_balance, Decimal)
         assert balance.currency  # Usually "ZAR" in sandbox
 
+    def test_get_all_balances(self, client: InvestecClient) -> None:
+        """Test fetching balances for several accounts concurrently."""
+        accounts = client.get_accounts()
+        account_ids = [account.account_id for account in accounts]
+
+        balances = client.get_all_balances(account_ids)
+
+        assert list(balances) == account_ids
+        for account_id, balance in balances.items():
+            assert isinstance(balance, AccountBalance)
+            assert balance.account_id == account_id
+
     def test_get_account_transactions(
         self, client: InvestecClient, account_id: str
     ) -> None:
@@ -0,0 +1,267 @@
+"""Offline tests for the Investec API models."""
+
+import subprocess
+import sys
+from decimal import Decimal
+
+import pytest
+
+from investec_api.models import (
+    Account,
+    AccountBalance,
+    Beneficiary,
+    PendingTransaction,
+    Transaction,
+)
+from investec_api.models._fast import decode_transactions
+from investec_api.models.beneficiary import BeneficiaryCategory
+from investec_api.models.payment import BeneficiaryPaymentItem
+from investec_api.models.transaction import TransactionStatus, TransactionType
+from investec_api.models.transfer import (
+    TransferItem,
+    TransferResponse,
+    TransferResponseItem,
+)
+from investec_api.models.base import BaseModel, _compile_build, _loads
+
+
+class TestLazyImports:
+    """Tests for the lazily loaded ``investec_api.models`` package."""
+
+    def test_accessing_one_model_loads_only_its_module(self) -> None:
+        """Model modules are imported on first access, not with the package."""
+        code = (
+            "import sys\n"
+            "import investec_api.models as models\n"
+            "models.Document\n"
+            "print(sorted(m for m in sys.modules if m.startswith(models.__name__)))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == str(
+            [
+                "investec_api.models",
+                "investec_api.models.base",
+                "investec_api.models.document",
+            ]
+        )
+
+    def test_unknown_name_raises_attribute_error(self) -> None:
+        """Names that aren't models are still reported as missing."""
+        import investec_api.models as models
+
+        with pytest.raises(AttributeError):
+            models.NotAModel
+
+
+class TestCompiledBuild:
+    """Tests for the ``_build`` functions generated from ``_FIELDS`` tables."""
+
+    def test_maps_api_keys_and_applies_defaults(self) -> None:
+        """API keys map to attributes and missing keys take their defaults."""
+        account = Account.from_dict(
+            {"accountId": "1", "accountName": "Main", "kycCompliant": True}
+        )
+
+        assert account.account_id == "1"
+        assert account.account_name == "Main"
+        assert account.kyc_compliant is True
+        assert account.account_number == ""
+        assert account.profile_name == ""
+
+    def test_matches_generic_build(self) -> None:
+        """The generated builder agrees with the table-looping fallback."""
+        data = {"accountId": "1", "productName": "Private Bank Account"}
+
+        assert Account._build(data) == BaseModel._build.__func__(Account, data)
+
+    def test_overrides_replace_mapped_values(self) -> None:
+        """Keyword overrides win over values read from the data."""
+        build = _compile_build(Account._FIELDS, frozenset())
+
+        account = build(Account, {"accountId": "1"}, account_id="2")
+
+        assert account.account_id == "2"
+
+    def test_interns_listed_fields(self) -> None:
+        """Fields listed in ``_INTERNED`` share one string object."""
+        first = Beneficiary.from_dict({"beneficiaryId": "1", "bank": "".join("ABSA")})
+        second = Beneficiary.from_dict(
+            {"beneficiaryId": "2", "bank": "".join(["AB", "SA"])}
+        )
+
+        assert first.bank is second.bank
+
+
+class TestFromJson:
+    """Tests for building models straight from raw response bodies."""
+
+    def test_amounts_decode_to_exact_decimals(self) -> None:
+        """Non-integer numbers never pass through float."""
+        balance = AccountBalance.from_json(
+            b'{"data": {"accountId": "1", "currentBalance": 0.1,'
+            b' "availableBalance": 1234567890.12, "budgetBalance": 5,'
+            b' "straightBalance": "7.10", "cashBalance": 0.30, "currency": "ZAR"}}'
+        )
+
+        assert balance.current_balance == Decimal("0.1")
+        assert balance.available_balance == Decimal("1234567890.12")
+        assert balance.budget_balance == Decimal(5)
+        assert balance.straight_balance == Decimal("7.10")
+        assert str(balance.cash_balance) == "0.30"
+
+    def test_builds_nested_models(self) -> None:
+        """Nested response items become model instances."""
+        response = TransferResponse.from_json(
+            b'{"data": {"transferResponse": {"TransferResponses": ['
+            b'{"PaymentReferenceNumber": "ref-1", "Status": "OK"},'
+            b'{"PaymentReferenceNumber": "ref-2", "AuthorisationRequired": true}'
+            b'], "ErrorMessage": null}}}'
+        )
+
+        assert response.transfer_responses == [
+            TransferResponseItem(payment_reference_number="ref-1", status="OK"),
+            TransferResponseItem(
+                payment_reference_number="ref-2", authorisation_required=True
+            ),
+        ]
+        assert response.error_message is None
+
+    def test_matches_from_api_response(self) -> None:
+        """from_json agrees with decoding and calling from_api_response."""
+        raw = b'{"data": {"accountId": "1", "currentBalance": 99.99}}'
+
+        assert AccountBalance.from_json(raw) == AccountBalance.from_api_response(
+            _loads(raw)
+        )
+
+    def test_empty_body_is_an_empty_response(self) -> None:
+        """An empty body builds the same model as an empty JSON object."""
+        assert AccountBalance.from_json(b"") == AccountBalance.from_dict({})
+
+
+class TestTransaction:
+    """Tests for Transaction parsing."""
+
+    def test_type_and_status_format_as_api_values(self) -> None:
+        """Enum fields format as their plain API values."""
+        transaction = Transaction.from_dict({"type": "CREDIT", "status": "PENDING"})
+
+        assert f"{transaction.type} {transaction.status}" == "CREDIT PENDING"
+        assert str(transaction.to_dict()["status"]) == "PENDING"
+
+    @pytest.mark.parametrize(
+        "data, expected_type, expected_status",
+        [
+            ({}, "DEBIT", "POSTED"),
+            ({"type": None, "status": None}, "DEBIT", "POSTED"),
+            ({"type": "CREDIT", "status": "PENDING"}, "CREDIT", "PENDING"),
+            ({"type": "REFUND", "status": "REVERSED"}, "REFUND", "REVERSED"),
+            ({"type": "credit", "status": "posted"}, "credit", "posted"),
+        ],
+    )
+    def test_only_missing_type_and_status_take_defaults(
+        self, data: dict, expected_type: str, expected_status: str
+    ) -> None:
+        """Unknown values are kept as sent, never coerced to DEBIT or POSTED."""
+        transaction = Transaction.from_dict(data)
+        pending = PendingTransaction.from_dict(data)
+
+        assert (transaction.type, transaction.status) == (
+            expected_type,
+            expected_status,
+        )
+        assert pending.type == expected_type
+
+    def test_known_values_map_to_enum_members(self) -> None:
+        """Recognised API values become enum members."""
+        transaction = Transaction.from_dict({"type": "CREDIT", "status": "POSTED"})
+
+        assert transaction.type is TransactionType.CREDIT
+        assert transaction.status is TransactionStatus.POSTED
+
+    @pytest.mark.parametrize(
+        "row",
+        [
+            b'{"accountId": "1", "type": "CREDIT", "transactionType": "Deposit",'
+            b' "status": "POSTED", "description": "Salary", "cardNumber": "",'
+            b' "postedOrder": 3, "postingDate": "2024-01-02",'
+            b' "valueDate": "2024-01-02", "actionDate": "2024-01-03",'
+            b' "transactionDate": "2024-01-01", "amount": 1500.25,'
+            b' "runningBalance": 9000.5, "uuid": "u1"}',
+            b"{}",
+            b'{"type": "REFUND", "postingDate": "not-a-date", "amount": "12.30"}',
+            b'{"type": null, "status": "posted"}',
+        ],
+    )
+    def test_from_struct_matches_from_dict(self, row: bytes) -> None:
+        """The typed struct path builds the same Transaction as the dict path."""
+        raw = b'{"data": {"transactions": [' + row + b"]}}"
+
+        (struct,) = decode_transactions(raw).data.transactions
+        (data,) = _loads(raw)["data"]["transactions"]
+
+        assert Transaction.from_struct(struct) == Transaction.from_dict(data)
+
+
+class TestBeneficiaryCategory:
+    """Tests for BeneficiaryCategory parsing."""
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [
+            ("true", True),
+            ("True", True),
+            ("1", True),
+            ("false", False),
+            ("", False),
+            (True, True),
+            (False, False),
+            (None, False),
+        ],
+    )
+    def test_is_default_parsing(self, value: object, expected: bool) -> None:
+        """isDefault accepts the API's string flags as well as booleans."""
+        category = BeneficiaryCategory.from_dict({"id": "1", "isDefault": value})
+
+        assert category.is_default is expected
+
+    def test_is_default_missing(self) -> None:
+        """A missing isDefault means the category is not the default."""
+        assert BeneficiaryCategory.from_dict({"id": "1"}).is_default is False
+
+
+class TestRequestAmounts:
+    """Tests for the amounts sent in transfer and payment requests."""
+
+    @pytest.mark.parametrize(
+        "amount, expected",
+        [("10", "10.00"), ("10.5", "10.50"), ("1E+1", "10.00"), (12, "12.00")],
+    )
+    def test_amounts_format_as_two_decimal_strings(
+        self, amount: object, expected: str
+    ) -> None:
+        """Exact amounts are sent in plain fixed-point form."""
+        item = TransferItem(
+            beneficiary_account_id="1",
+            amount=amount,
+            my_reference="Mine",
+            their_reference="Theirs",
+        )
+
+        assert item.to_dict()["amount"] == expected
+
+    @pytest.mark.parametrize("amount", ["10.005", "10.015", "0.001"])
+    def test_sub_cent_amounts_are_rejected(self, amount: str) -> None:
+        """Amounts are never rounded to fit the API's two decimal places."""
+        with pytest.raises(ValueError):
+            TransferItem(
+                beneficiary_account_id="1",
+                amount=amount,
+                my_reference="Mine",
+                their_reference="Theirs",
+            )
+        with pytest.raises(ValueError):
+            BeneficiaryPaymentItem.from_dict({"beneficiaryId": "1", "amount": amount})
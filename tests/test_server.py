@@ -0,0 +1,428 @@
+"""Offline tests for the MCP server tools, using a stubbed client."""
+
+import asyncio
+import gc
+from typing import List
+
+import msgspec
+import pytest
+
+pytest.importorskip("mcp.server.fastmcp")
+
+import server  # noqa: E402
+from investec_api.exceptions import InvestecRateLimitError  # noqa: E402
+from investec_api.models import Transaction  # noqa: E402
+from investec_api.models.transfer import (  # noqa: E402
+    TransferResponse,
+    TransferResponseItem,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_server_state(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Give each test empty caches and rate limits that never wait."""
+    monkeypatch.setattr(server, "_cache", {})
+    monkeypatch.setattr(server, "_inflight", {})
+    monkeypatch.setattr(server, "read_bucket", server.AsyncTokenBucket(1000, 1000))
+    monkeypatch.setattr(server, "write_bucket", server.AsyncTokenBucket(1000, 1000))
+
+
+class FakeClock:
+    """Monotonic clock for the rate limiter that only moves when slept on."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.sleeps: List[float] = []
+
+    def monotonic(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.sleeps.append(delay)
+        self.now += delay
+
+
+class TestAsyncTokenBucket:
+    """Tests for the outbound rate limiter, run against a fake clock."""
+
+    @pytest.fixture
+    def clock(self, monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+        clock = FakeClock()
+        monkeypatch.setattr(server, "time", clock)
+        monkeypatch.setattr(asyncio, "sleep", clock.sleep)
+        return clock
+
+    def test_burst_within_capacity_does_not_wait(self, clock: FakeClock) -> None:
+        """Up to ``capacity`` tokens are handed out immediately."""
+        bucket = server.AsyncTokenBucket(capacity=5, refill_rate=1)
+
+        async def acquire_burst() -> None:
+            for _ in range(5):
+                await bucket.acquire()
+
+        asyncio.run(acquire_burst())
+
+        assert clock.sleeps == []
+        assert bucket.tokens == 0
+
+    def test_acquire_waits_for_refill(self, clock: FakeClock) -> None:
+        """Past capacity, each caller waits for one token to refill."""
+        bucket = server.AsyncTokenBucket(capacity=2, refill_rate=20)
+
+        async def acquire_past_capacity() -> None:
+            for _ in range(4):
+                await bucket.acquire()
+
+        asyncio.run(acquire_past_capacity())
+
+        assert clock.sleeps == [pytest.approx(0.05), pytest.approx(0.05)]
+        assert bucket.tokens == pytest.approx(0)
+
+    def test_refill_is_capped_at_capacity(self, clock: FakeClock) -> None:
+        """Idle time refills the bucket, but never beyond its capacity."""
+        bucket = server.AsyncTokenBucket(capacity=2, refill_rate=20)
+        bucket.tokens = 0
+
+        clock.now += 0.05
+        bucket._refill()
+        assert bucket.tokens == pytest.approx(1)
+
+        clock.now += 60
+        bucket._refill()
+        assert bucket.tokens == 2
+
+    def test_penalize_puts_bucket_into_debt(self, clock: FakeClock) -> None:
+        """After a 429 the next caller waits even with a full bucket."""
+        bucket = server.AsyncTokenBucket(capacity=10, refill_rate=20)
+
+        bucket.penalize()
+        assert bucket.tokens == -10
+
+        asyncio.run(bucket.acquire())
+
+        # Climbing from -10 to one token at 20 per second takes 0.55s
+        assert clock.sleeps == [pytest.approx(0.55)]
+        assert bucket.tokens == pytest.approx(0)
+
+    def test_call_api_penalizes_on_rate_limit(self, clock: FakeClock) -> None:
+        """A 429 from the client pushes the bucket into debt and re-raises."""
+        bucket = server.AsyncTokenBucket(capacity=10, refill_rate=1)
+
+        def rate_limited() -> None:
+            raise InvestecRateLimitError("Rate limit exceeded", 429)
+
+        with pytest.raises(InvestecRateLimitError):
+            asyncio.run(server.call_api(bucket, rate_limited))
+        assert bucket.tokens == -1
+
+
+class TestTtlCached:
+    """Tests for caching and coalescing read-only lookups."""
+
+    @pytest.fixture
+    def lookup(self, monkeypatch: pytest.MonkeyPatch):
+        """A cached lookup that counts its upstream calls."""
+        monkeypatch.setattr(server.config, "cache_ttl", 60)
+        calls = []
+
+        @server.ttl_cached
+        async def fetch(account_id: str) -> str:
+            calls.append(account_id)
+            result = f"balance-{len(calls)}"
+            await asyncio.sleep(0.01)
+            return result
+
+        return fetch, calls
+
+    def test_concurrent_calls_share_one_fetch(self, lookup) -> None:
+        """Callers arriving while a fetch runs wait on it instead of refetching."""
+        fetch, calls = lookup
+
+        async def fetch_concurrently():
+            return await asyncio.gather(*(fetch("1") for _ in range(5)))
+
+        assert asyncio.run(fetch_concurrently()) == ["balance-1"] * 5
+        assert calls == ["1"]
+
+    def test_results_are_cached_per_arguments(self, lookup) -> None:
+        """A repeat call is served from the cache; other arguments are not."""
+        fetch, calls = lookup
+
+        async def fetch_in_turn():
+            return [await fetch("1"), await fetch("1"), await fetch("2")]
+
+        assert asyncio.run(fetch_in_turn()) == ["balance-1", "balance-1", "balance-2"]
+        assert calls == ["1", "2"]
+
+    def test_failures_are_not_cached(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A failed lookup is retried on the next call."""
+        monkeypatch.setattr(server.config, "cache_ttl", 60)
+        calls = []
+
+        @server.ttl_cached
+        async def flaky() -> str:
+            calls.append(None)
+            if len(calls) == 1:
+                raise RuntimeError("upstream failed")
+            return "ok"
+
+        async def call_twice():
+            with pytest.raises(RuntimeError):
+                await flaky()
+            return await flaky()
+
+        assert asyncio.run(call_twice()) == "ok"
+        assert len(calls) == 2
+
+    def test_clear_cache_forces_refetch(self, lookup) -> None:
+        """Cleared results are fetched again."""
+        fetch, calls = lookup
+
+        async def fetch_around_clear():
+            first = await fetch("1")
+            server.clear_cache()
+            return first, await fetch("1")
+
+        assert asyncio.run(fetch_around_clear()) == ("balance-1", "balance-2")
+        assert len(calls) == 2
+
+    def test_fetch_in_flight_during_clear_is_not_cached(self, lookup) -> None:
+        """A result fetched before a write is neither cached nor shared after it."""
+        fetch, calls = lookup
+
+        async def clear_during_fetch():
+            stale = asyncio.ensure_future(fetch("1"))
+            await asyncio.sleep(0)
+            server.clear_cache()
+            fresh = await fetch("1")
+            return await stale, fresh, await fetch("1")
+
+        assert asyncio.run(clear_during_fetch()) == (
+            "balance-1",
+            "balance-2",
+            "balance-2",
+        )
+        assert len(calls) == 2
+
+
+class TestSingleFlight:
+    """Tests for coalescing uncached reads."""
+
+    def test_concurrent_calls_share_one_fetch(self) -> None:
+        """Concurrent callers share a fetch; later calls fetch again."""
+        calls = []
+
+        @server.single_flight
+        async def fetch(account_id: str) -> int:
+            calls.append(account_id)
+            await asyncio.sleep(0.01)
+            return len(calls)
+
+        async def fetch_twice():
+            first = await asyncio.gather(*(fetch("1") for _ in range(5)))
+            return first, await fetch("1")
+
+        assert asyncio.run(fetch_twice()) == ([1] * 5, 2)
+        assert calls == ["1", "1"]
+
+    def test_unawaited_failure_is_not_reported_as_unretrieved(self) -> None:
+        """A fetch that fails after its only caller gave up isn't logged."""
+        unhandled = []
+
+        @server.single_flight
+        async def failing() -> None:
+            await asyncio.sleep(0.01)
+            raise RuntimeError("upstream failed")
+
+        async def abandon_fetch() -> None:
+            asyncio.get_running_loop().set_exception_handler(
+                lambda loop, context: unhandled.append(context)
+            )
+            with pytest.raises(asyncio.TimeoutError):
+                await asyncio.wait_for(failing(), timeout=0.001)
+            await asyncio.sleep(0.05)
+            gc.collect()
+
+        asyncio.run(abandon_fetch())
+        assert unhandled == []
+
+
+class TestBatchedWrites:
+    """Tests for sending transfers and payments in batches."""
+
+    @staticmethod
+    def _transfers_json(count: int) -> str:
+        return msgspec.json.encode(
+            [
+                {
+                    "beneficiary_account_id": str(i),
+                    "amount": "1.00",
+                    "my_reference": "Mine",
+                    "their_reference": "Theirs",
+                }
+                for i in range(count)
+            ]
+        ).decode()
+
+    @staticmethod
+    def _respond(batch) -> TransferResponse:
+        return TransferResponse(
+            transfer_responses=[
+                TransferResponseItem(
+                    payment_reference_number=f"ref-{item.beneficiary_account_id}",
+                    status="OK",
+                )
+                for item in batch
+            ]
+        )
+
+    def test_batched_splits_into_consecutive_chunks(self) -> None:
+        """Items keep their order and only the last chunk is short."""
+        chunks = server.batched(list(range(250)))
+
+        assert [len(chunk) for chunk in chunks] == [100, 100, 50]
+        assert [item for chunk in chunks for item in chunk] == list(range(250))
+        assert server.batched([]) == []
+
+    def test_batches_are_sent_in_order(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each batch is sent after the previous one, never concurrently."""
+        sent = []
+
+        def transfer_multiple(account_id, batch, profile_id=None):
+            sent.append([item.beneficiary_account_id for item in batch])
+            return self._respond(batch)
+
+        monkeypatch.setattr(server.client, "transfer_multiple", transfer_multiple)
+
+        output = asyncio.run(
+            server.transfer_multiple("account-1", self._transfers_json(250))
+        )
+
+        assert [batch[0] for batch in sent] == ["0", "100", "200"]
+        assert output.count("Status: OK") == 250
+
+    def test_partial_failure_reports_unknown_and_unsent_items(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A failed batch stops the run; its outcome is unknown, not unsent."""
+        calls = []
+
+        def transfer_multiple(account_id, batch, profile_id=None):
+            calls.append(batch)
+            if len(calls) == 2:
+                raise RuntimeError("upstream failed")
+            return self._respond(batch)
+
+        monkeypatch.setattr(server.client, "transfer_multiple", transfer_multiple)
+        server._cache["stale"] = (float("inf"), "balance")
+
+        output = asyncio.run(
+            server.transfer_multiple("account-1", self._transfers_json(250))
+        )
+
+        assert len(calls) == 2
+        assert "Payment Reference: ref-99\n" in output
+        assert "ref-100\n" not in output
+        assert "Error executing transfers: upstream failed" in output
+        assert output.endswith(
+            "Outcome unknown: transfers 101-200 of 250"
+            " — check transactions before retrying.\n"
+            "Not sent: transfers 201-250 of 250."
+        )
+        assert server._cache == {}
+
+    def test_failed_first_batch_sends_nothing(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """With no batch through, the reply is the error and the cache stays."""
+        calls = []
+
+        def pay_beneficiaries(account_id, batch):
+            calls.append(batch)
+            raise RuntimeError("upstream failed")
+
+        monkeypatch.setattr(server.client, "pay_beneficiaries", pay_beneficiaries)
+        server._cache["accounts"] = (float("inf"), "accounts")
+        payments = msgspec.json.encode(
+            [
+                {
+                    "beneficiary_id": str(i),
+                    "amount": "1.00",
+                    "my_reference": "Mine",
+                    "their_reference": "Theirs",
+                }
+                for i in range(150)
+            ]
+        ).decode()
+
+        output = asyncio.run(server.pay_beneficiaries("account-1", payments))
+
+        assert len(calls) == 1
+        assert output == (
+            "Error making beneficiary payments: upstream failed\n"
+            "Outcome unknown: payments 1-100 of 150"
+            " — check transactions before retrying.\n"
+            "Not sent: payments 101-150 of 150."
+        )
+        assert "accounts" in server._cache
+
+    @pytest.mark.parametrize(
+        "sent, total, expected",
+        [
+            (
+                0,
+                1,
+                "Outcome unknown: payments 1 of 1 — check transactions before"
+                " retrying.",
+            ),
+            (
+                100,
+                101,
+                "Outcome unknown: payments 101 of 101 — check transactions before"
+                " retrying.",
+            ),
+            (
+                0,
+                101,
+                "Outcome unknown: payments 1-100 of 101 — check transactions"
+                " before retrying.\nNot sent: payments 101 of 101.",
+            ),
+        ],
+    )
+    def test_format_failed_batch_numbers_items_from_one(
+        self, sent: int, total: int, expected: str
+    ) -> None:
+        """Only the batches after the failed one are reported as not sent."""
+        assert server.format_failed_batch("payments", sent, total) == expected
+
+
+class TestFormatting:
+    """Tests for the text the tools return."""
+
+    def test_transaction_output_shows_plain_type_and_status(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Transactions print their API type and status, not enum reprs."""
+        transactions = [
+            Transaction.from_dict(
+                {
+                    "type": "DEBIT",
+                    "status": "POSTED",
+                    "description": "Coffee",
+                    "amount": "35.50",
+                    "transactionDate": "2024-01-02",
+                }
+            )
+        ]
+        monkeypatch.setattr(
+            server.client,
+            "get_account_transactions",
+            lambda account_id, **filters: transactions,
+        )
+
+        output = asyncio.run(server.get_account_transactions("account-1"))
+
+        assert "Status: POSTED\n" in output
+        assert "Description: Coffee\n" in output
+        assert "Amount: 35.50 \n" in output
+        assert "TransactionStatus" not in output